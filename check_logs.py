@@ -18,7 +18,15 @@ Usage:
 import sys
 import os
 import argparse
+import functools
+import hashlib
+import json
+import mmap
+import re
+from collections import Counter, deque
 from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, Optional
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -26,6 +34,28 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 LOG_DIR = "logs"
 LOG_FILE = "daisho.log"
 
+# Read size for streaming scans
+SCAN_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+# Block size for reading backwards from the end of the log
+TAIL_BLOCK_SIZE = 64 * 1024  # 64 KiB
+
+# Level tokens as they appear in the file formatter's "| LEVEL" column
+_LEVELS = {
+    level.encode(): level
+    for level in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+# Byte range of the level column between the first two "|" separators.
+# Defaults to the file formatter's layout ("%Y-%m-%d %H:%M:%S | LEVEL    |")
+# and is re-detected from the log's first line by detect_level_slice().
+_LEVEL_SLICE = slice(21, 31)
+ERROR_LEVELS = frozenset({"ERROR", "CRITICAL"})
+WARNING_LEVELS = frozenset({"WARNING"})
+
+# Health-summary sidecar cache
+SUMMARY_VERSION = 1
+SUMMARY_KEEP = 100  # Recent errors/warnings retained in the summary
+SUMMARY_HEAD_BYTES = 4096  # Prefix hashed to detect rotation
+
 
 def get_log_path() -> str:
     """Get the full path to the log file."""
@@ -40,8 +70,342 @@ def print_header(title: str) -> None:
     print("=" * 60)
 
 
-def show_log_health() -> None:
-    """Display log file health summary."""
+def summary_path(log_path: str) -> str:
+    """Get the path of the health-summary sidecar for a log file."""
+    head, name = os.path.split(log_path)
+    return os.path.join(head, f".{name}.summary.json")
+
+
+def load_or_build_summary(
+    log_path: str,
+    keep: int = SUMMARY_KEEP,
+    st: Optional[os.stat_result] = None,
+) -> dict:
+    """
+    Load the cached health summary, rescanning only what changed.
+
+    The sidecar is keyed by the log's size and mtime. If they match, the
+    cached summary is returned as-is; if the log only grew, just the new
+    bytes are scanned and merged in. Anything else (rotation, truncation,
+    a missing or corrupt sidecar) triggers a full rescan.
+
+    Args:
+        log_path: Path to the log file
+        keep: Number of recent errors/warnings to retain
+        st: Existing stat result for the log, to avoid another stat call
+
+    Returns:
+        Dictionary with "counts", "errors" and "warnings"
+    """
+    if st is None:
+        st = os.stat(log_path)
+    cache_path = summary_path(log_path)
+
+    cache = None
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get("version") != SUMMARY_VERSION or cache.get("keep", 0) < keep:
+            cache = None
+    except (OSError, ValueError):
+        cache = None
+
+    if cache and cache["size"] == st.st_size and cache["mtime"] == st.st_mtime_ns:
+        return cache
+
+    with open(log_path, 'rb') as f:
+        head = hashlib.sha1(f.read(SUMMARY_HEAD_BYTES)).hexdigest()
+        end = _last_line_end(f, st.st_size)
+
+    start = 0
+    if (cache and cache["head"] == head
+            and st.st_size >= cache["size"]
+            and st.st_mtime_ns >= cache["mtime"]):
+        # Same file, appended to since the last run
+        start = cache["last_offset"]
+    else:
+        cache = {"counts": dict.fromkeys(_LEVELS.values(), 0), "errors": [], "warnings": []}
+
+    delta = count_levels(log_path, _LEVELS.values(), start, end)
+    errors: list[str] = []
+    warnings: list[str] = []
+    for raw in iter_lines_reversed(log_path, start=start, end=end):
+        level = _line_level(raw)
+        if level in ERROR_LEVELS and len(errors) < keep:
+            errors.append(_decode(raw).strip())
+        elif level in WARNING_LEVELS and len(warnings) < keep:
+            warnings.append(_decode(raw).strip())
+        if len(errors) >= keep and len(warnings) >= keep:
+            break
+    errors.reverse()
+    warnings.reverse()
+
+    summary = {
+        "version": SUMMARY_VERSION,
+        "size": st.st_size,
+        "mtime": st.st_mtime_ns,
+        "head": head,
+        "last_offset": end,
+        "keep": keep,
+        "counts": {level: cache["counts"].get(level, 0) + n for level, n in delta.items()},
+        "errors": (cache["errors"] + errors)[-keep:],
+        "warnings": (cache["warnings"] + warnings)[-keep:],
+    }
+
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False)
+    except OSError:
+        pass  # The cache is an optimization only
+
+    return summary
+
+
+def _last_line_end(f, size: int) -> int:
+    """Return the offset just past the last newline, so partial lines are rescanned later."""
+    pos = size
+    while pos > 0:
+        step = min(TAIL_BLOCK_SIZE, pos)
+        pos -= step
+        f.seek(pos)
+        index = f.read(step).rfind(b"\n")
+        if index != -1:
+            return pos + index + 1
+    return 0
+
+
+def scan_log(
+    log_path: str,
+    count: int,
+    tail_n: int,
+) -> tuple[Counter, deque, deque, deque]:
+    """
+    Scan the log once, collecting every aggregation used by --all.
+
+    Args:
+        log_path: Path to the log file
+        count: Number of recent errors/warnings to keep
+        tail_n: Number of trailing lines to keep
+
+    Returns:
+        Tuple of (level counts, recent errors, recent warnings, tail lines)
+    """
+    counts: Counter = Counter()
+    errors: deque = deque(maxlen=count)
+    warnings: deque = deque(maxlen=count)
+    tail: deque = deque(maxlen=tail_n)
+
+    def consume(raw: bytes) -> None:
+        level = _line_level(raw)
+        if level is not None:
+            counts[level] += 1
+            if level in ERROR_LEVELS:
+                errors.append(raw)
+            elif level in WARNING_LEVELS:
+                warnings.append(raw)
+        tail.append(raw)
+
+    pending = b""
+    with open(log_path, 'rb') as f:
+        while True:
+            chunk = f.read(SCAN_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines = (pending + chunk).split(b"\n")
+            pending = lines.pop()
+            for raw in lines:
+                consume(raw)
+    if pending:
+        consume(pending)
+
+    # Only the retained lines are ever decoded
+    return (
+        counts,
+        deque((_decode(raw).strip() for raw in errors), maxlen=count),
+        deque((_decode(raw).strip() for raw in warnings), maxlen=count),
+        deque((_decode(raw).rstrip() for raw in tail), maxlen=tail_n),
+    )
+
+
+def count_levels(
+    log_path: str,
+    levels: Iterable[str] = ("ERROR", "WARNING", "INFO", "DEBUG"),
+    start: int = 0,
+    end: Optional[int] = None,
+) -> dict[str, int]:
+    """
+    Count log entries per level without decoding individual lines.
+
+    The file is memory-mapped and scanned once with a single compiled
+    pattern matching every requested level's "| LEVEL    |" column.
+    Scanning proceeds in chunks cut at line boundaries so the list of
+    matches stays small.
+
+    Args:
+        log_path: Path to the log file
+        levels: Levels to count
+        start: Byte offset to start counting from
+        end: Byte offset to stop counting at (end of file if None)
+
+    Returns:
+        Entry counts keyed by level
+    """
+    levels = tuple(levels)
+    counts = dict.fromkeys(levels, 0)
+    pattern = _level_pattern(levels)
+
+    with open(log_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            # Nothing to count (and empty files cannot be mapped)
+            return counts
+
+        found: Counter = Counter()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = start
+            while pos < end:
+                stop = mm.find(b"\n", pos + SCAN_CHUNK_SIZE, end)
+                stop = end if stop == -1 else stop + 1
+                found.update(pattern.findall(mm, pos, stop))
+                pos = stop
+
+    for raw, n in found.items():
+        counts[_LEVELS[raw]] += n
+    return counts
+
+
+@functools.lru_cache(maxsize=None)
+def _level_pattern(levels: tuple[str, ...]) -> re.Pattern:
+    """Compile the level-column pattern for a set of levels."""
+    alternatives = b"|".join(re.escape(level.encode()) for level in levels)
+    return re.compile(rb"\| (" + alternatives + rb") *\|")
+
+
+def iter_lines_reversed(
+    log_path: str,
+    block: int = TAIL_BLOCK_SIZE,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Yield raw log lines from the end of the file backwards.
+
+    Reads fixed-size blocks from EOF towards the start, so callers that
+    stop early only touch the tail of the file.
+
+    Args:
+        log_path: Path to the log file
+        block: Number of bytes to read per step
+        start: Byte offset of the first line to consider
+        end: Byte offset to read back from (end of file if None)
+
+    Yields:
+        Lines without their trailing newline, newest first
+    """
+    with open(log_path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size if end is None else min(end, size)
+        pos = end
+        pending = b""
+        at_end = True
+        while pos > start:
+            step = min(block, pos - start)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + pending).split(b"\n")
+            # The first piece may be the tail of a line that starts in an earlier block
+            pending = lines[0]
+            newer = lines[1:]
+            if at_end and newer:
+                # Skip the empty piece after the file's final newline
+                at_end = False
+                if not newer[-1]:
+                    newer.pop()
+            yield from reversed(newer)
+        if end > start:
+            yield pending
+
+
+def tail_bytes(log_path: str, n: int, block: int = TAIL_BLOCK_SIZE) -> list[bytes]:
+    """
+    Return the last N raw lines of a file without reading all of it.
+
+    Args:
+        log_path: Path to the log file
+        n: Number of lines to return
+        block: Number of bytes to read per step
+
+    Returns:
+        Up to N lines in file order
+    """
+    lines = list(islice(iter_lines_reversed(log_path, block), n))
+    lines.reverse()
+    return lines
+
+
+def _recent_by_level(log_path: str, levels: frozenset, count: int) -> list[str]:
+    """Collect the last COUNT lines whose level is in LEVELS, scanning from EOF."""
+    matches = []
+    if count <= 0:
+        return matches
+    for raw in iter_lines_reversed(log_path):
+        if _line_level(raw) in levels:
+            matches.append(_decode(raw).strip())
+            if len(matches) >= count:
+                break
+    matches.reverse()
+    return matches
+
+
+def detect_level_slice(log_path: str) -> slice:
+    """
+    Locate the level column from the first line of the log.
+
+    Updates the module-level slice used by every level filter, so each
+    line is classified with one fixed-position compare.
+
+    Args:
+        log_path: Path to the log file
+
+    Returns:
+        The detected (or default) level column slice
+    """
+    global _LEVEL_SLICE
+
+    try:
+        with open(log_path, 'rb') as f:
+            first_line = f.readline()
+    except OSError:
+        return _LEVEL_SLICE
+
+    first = first_line.find(b"|")
+    second = first_line.find(b"|", first + 1) if first != -1 else -1
+    if second != -1 and _LEVELS.get(first_line[first + 1:second].strip()):
+        _LEVEL_SLICE = slice(first + 1, second)
+    return _LEVEL_SLICE
+
+
+def _line_level(raw: bytes) -> Optional[str]:
+    """Extract the level column from a raw log line, or None if absent."""
+    return _LEVELS.get(raw[_LEVEL_SLICE].strip())
+
+
+def _decode(raw: bytes) -> str:
+    """Decode a raw log line, tolerating partial UTF-8 sequences."""
+    return raw.decode('utf-8', errors='replace')
+
+
+def show_log_health(counts: Optional[Mapping[str, int]] = None) -> Optional[Mapping[str, int]]:
+    """
+    Display log file health summary.
+
+    Args:
+        counts: Preloaded entry counts by level (scans the log if None)
+
+    Returns:
+        Entry counts by level, or None if the log could not be read
+    """
     log_path = get_log_path()
 
     print_header("LOG HEALTH SUMMARY")
@@ -49,26 +413,20 @@ def show_log_health() -> None:
     if not os.path.exists(log_path):
         print("Log file does not exist yet.")
         print(f"Expected location: {log_path}")
-        return
+        return None
 
-    # File stats
-    size_kb = os.path.getsize(log_path) / 1024
-    mtime = datetime.fromtimestamp(os.path.getmtime(log_path))
+    # File stats (one stat call, also reused as the summary cache key)
+    st = os.stat(log_path)
+    size_kb = st.st_size / 1024
+    mtime = datetime.fromtimestamp(st.st_mtime)
 
     print(f"Log file: {log_path}")
     print(f"Size: {size_kb:.1f} KB")
     print(f"Last modified: {mtime.strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Count entries by level
-    counts = {"ERROR": 0, "WARNING": 0, "INFO": 0, "DEBUG": 0}
-
     try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                for level in counts:
-                    if f"| {level}" in line:
-                        counts[level] += 1
-                        break
+        if counts is None:
+            counts = load_or_build_summary(log_path, st=st)["counts"]
 
         print()
         print("Entry counts:")
@@ -81,12 +439,21 @@ def show_log_health() -> None:
             print()
             print("⚠️  There are errors in the log. Use --errors to view them.")
 
+        return counts
+
     except Exception as e:
         print(f"Error reading log file: {e}")
+        return None
 
 
-def show_recent_errors(count: int = 20) -> None:
-    """Display recent error entries."""
+def show_recent_errors(count: int = 20, errors: Optional[Iterable[str]] = None) -> None:
+    """
+    Display recent error entries.
+
+    Args:
+        count: Number of entries to show
+        errors: Preloaded error lines (scans the log if None)
+    """
     log_path = get_log_path()
 
     print_header(f"RECENT ERRORS (last {count})")
@@ -95,12 +462,12 @@ def show_recent_errors(count: int = 20) -> None:
         print("Log file does not exist.")
         return
 
-    errors = []
     try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if '| ERROR' in line or '| CRITICAL' in line:
-                    errors.append(line.strip())
+        if errors is None and count <= SUMMARY_KEEP:
+            errors = load_or_build_summary(log_path)["errors"]
+        elif errors is None:
+            errors = _recent_by_level(log_path, ERROR_LEVELS, count)
+        errors = list(errors)
 
         if not errors:
             print("No errors found in log file. ✓")
@@ -113,8 +480,14 @@ def show_recent_errors(count: int = 20) -> None:
         print(f"Error reading log file: {e}")
 
 
-def show_recent_warnings(count: int = 20) -> None:
-    """Display recent warning entries."""
+def show_recent_warnings(count: int = 20, warnings: Optional[Iterable[str]] = None) -> None:
+    """
+    Display recent warning entries.
+
+    Args:
+        count: Number of entries to show
+        warnings: Preloaded warning lines (scans the log if None)
+    """
     log_path = get_log_path()
 
     print_header(f"RECENT WARNINGS (last {count})")
@@ -123,12 +496,12 @@ def show_recent_warnings(count: int = 20) -> None:
         print("Log file does not exist.")
         return
 
-    warnings = []
     try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if '| WARNING' in line:
-                    warnings.append(line.strip())
+        if warnings is None and count <= SUMMARY_KEEP:
+            warnings = load_or_build_summary(log_path)["warnings"]
+        elif warnings is None:
+            warnings = _recent_by_level(log_path, WARNING_LEVELS, count)
+        warnings = list(warnings)
 
         if not warnings:
             print("No warnings found in log file. ✓")
@@ -141,8 +514,14 @@ def show_recent_warnings(count: int = 20) -> None:
         print(f"Error reading log file: {e}")
 
 
-def show_tail(count: int = 50) -> None:
-    """Display last N log entries."""
+def show_tail(count: int = 50, lines: Optional[Iterable[str]] = None) -> None:
+    """
+    Display last N log entries.
+
+    Args:
+        count: Number of entries to show
+        lines: Preloaded trailing lines (reads the log if None)
+    """
     log_path = get_log_path()
 
     print_header(f"LAST {count} LOG ENTRIES")
@@ -152,8 +531,9 @@ def show_tail(count: int = 50) -> None:
         return
 
     try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+        if lines is None:
+            lines = [_decode(raw) for raw in tail_bytes(log_path, count)]
+        lines = list(lines)
 
         for line in lines[-count:]:
             print(line.rstrip())
@@ -162,102 +542,134 @@ def show_tail(count: int = 50) -> None:
         print(f"Error reading log file: {e}")
 
 
-def show_system_diagnostics() -> None:
-    """Display system diagnostics."""
-    import platform
-
-    print_header("SYSTEM DIAGNOSTICS")
-
-    # Platform info
-    print("Platform Information:")
-    print(f"  OS: {platform.system()} {platform.release()}")
-    print(f"  Version: {platform.version()}")
-    print(f"  Machine: {platform.machine()}")
-    print(f"  Processor: {platform.processor()}")
-    print(f"  Python: {sys.version}")
-    print(f"  Executable: {sys.executable}")
-
-    # Memory info
+# Packages whose versions are reported by --system: (display name, import name)
+DIAGNOSTIC_PACKAGES = [
+    ("PyQt6", "PyQt6"),
+    ("manga-ocr", "manga_ocr"),
+    ("paddleocr", "paddleocr"),
+    ("paddlepaddle", "paddle"),
+    ("torch", "torch"),
+    ("opencv", "cv2"),
+    ("Pillow", "PIL"),
+    ("numpy", "numpy"),
+    ("keyboard", "keyboard"),
+    ("mouse", "mouse"),
+    ("pyperclip", "pyperclip"),
+]
+
+
+def _probe_memory() -> list[str]:
+    """Report system memory, if psutil is available."""
     try:
         import psutil
         mem = psutil.virtual_memory()
-        print()
-        print("Memory:")
-        print(f"  Total: {mem.total / (1024**3):.1f} GB")
-        print(f"  Available: {mem.available / (1024**3):.1f} GB")
-        print(f"  Used: {mem.percent}%")
+        return [
+            "Memory:",
+            f"  Total: {mem.total / (1024**3):.1f} GB",
+            f"  Available: {mem.available / (1024**3):.1f} GB",
+            f"  Used: {mem.percent}%",
+        ]
     except ImportError:
-        print()
-        print("Memory: (install psutil for memory info)")
+        return ["Memory: (install psutil for memory info)"]
 
-    # GPU info
-    print()
-    print("GPU Support:")
 
-    # PyTorch
+def _probe_torch() -> list[str]:
+    """Report PyTorch CUDA support."""
     try:
         import torch
         if torch.cuda.is_available():
-            print(f"  PyTorch CUDA: Available")
-            print(f"    Device: {torch.cuda.get_device_name(0)}")
-            print(f"    CUDA Version: {torch.version.cuda}")
             props = torch.cuda.get_device_properties(0)
-            print(f"    GPU Memory: {props.total_memory / (1024**3):.1f} GB")
-        else:
-            print(f"  PyTorch CUDA: Not available (CPU mode)")
+            return [
+                "  PyTorch CUDA: Available",
+                f"    Device: {torch.cuda.get_device_name(0)}",
+                f"    CUDA Version: {torch.version.cuda}",
+                f"    GPU Memory: {props.total_memory / (1024**3):.1f} GB",
+            ]
+        return ["  PyTorch CUDA: Not available (CPU mode)"]
     except ImportError:
-        print("  PyTorch: Not installed")
+        return ["  PyTorch: Not installed"]
     except Exception as e:
-        print(f"  PyTorch: Error - {e}")
+        return [f"  PyTorch: Error - {e}"]
+
 
-    # PaddlePaddle
+def _probe_paddle() -> list[str]:
+    """Report PaddlePaddle CUDA support."""
     try:
         import paddle
         if paddle.device.is_compiled_with_cuda():
             gpu_count = paddle.device.cuda.device_count()
             if gpu_count > 0:
-                print(f"  PaddlePaddle CUDA: Available ({gpu_count} GPU(s))")
-            else:
-                print(f"  PaddlePaddle CUDA: Compiled but no GPU found")
+                return [f"  PaddlePaddle CUDA: Available ({gpu_count} GPU(s))"]
+            return ["  PaddlePaddle CUDA: Compiled but no GPU found"]
+        return ["  PaddlePaddle: CPU version"]
+    except ImportError:
+        return ["  PaddlePaddle: Not installed"]
+    except Exception as e:
+        return [f"  PaddlePaddle: Error - {e}"]
+
+
+def _probe_package(display_name: str, import_name: str) -> list[str]:
+    """Report the installed version of a package."""
+    try:
+        if import_name == "PIL":
+            from PIL import __version__ as version
+        elif import_name == "cv2":
+            import cv2
+            version = cv2.__version__
         else:
-            print(f"  PaddlePaddle: CPU version")
+            mod = __import__(import_name)
+            version = getattr(mod, "__version__", "installed")
+        return [f"  {display_name}: {version}"]
     except ImportError:
-        print("  PaddlePaddle: Not installed")
+        return [f"  {display_name}: Not installed"]
     except Exception as e:
-        print(f"  PaddlePaddle: Error - {e}")
+        return [f"  {display_name}: Error - {e}"]
 
-    # Package versions
-    print()
-    print("Package Versions:")
-    packages = [
-        ("PyQt6", "PyQt6"),
-        ("manga-ocr", "manga_ocr"),
-        ("paddleocr", "paddleocr"),
-        ("paddlepaddle", "paddle"),
-        ("torch", "torch"),
-        ("opencv", "cv2"),
-        ("Pillow", "PIL"),
-        ("numpy", "numpy"),
-        ("keyboard", "keyboard"),
-        ("mouse", "mouse"),
-        ("pyperclip", "pyperclip"),
-    ]
-
-    for display_name, import_name in packages:
-        try:
-            if import_name == "PIL":
-                from PIL import __version__ as version
-            elif import_name == "cv2":
-                import cv2
-                version = cv2.__version__
-            else:
-                mod = __import__(import_name)
-                version = getattr(mod, "__version__", "installed")
-            print(f"  {display_name}: {version}")
-        except ImportError:
-            print(f"  {display_name}: Not installed")
-        except Exception as e:
-            print(f"  {display_name}: Error - {e}")
+
+def show_system_diagnostics() -> None:
+    """Display system diagnostics."""
+    import platform
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Heavy imports (torch, paddle, ...) dominate the run time, so all
+    # probes run concurrently and are printed in their usual order
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        memory = pool.submit(_probe_memory)
+        gpu = [pool.submit(_probe_torch), pool.submit(_probe_paddle)]
+        packages = [
+            pool.submit(_probe_package, display_name, import_name)
+            for display_name, import_name in DIAGNOSTIC_PACKAGES
+        ]
+
+        print_header("SYSTEM DIAGNOSTICS")
+
+        # Platform info
+        print("Platform Information:")
+        print(f"  OS: {platform.system()} {platform.release()}")
+        print(f"  Version: {platform.version()}")
+        print(f"  Machine: {platform.machine()}")
+        print(f"  Processor: {platform.processor()}")
+        print(f"  Python: {sys.version}")
+        print(f"  Executable: {sys.executable}")
+
+        # Memory info
+        print()
+        for line in memory.result():
+            print(line)
+
+        # GPU info
+        print()
+        print("GPU Support:")
+        for probe in gpu:
+            for line in probe.result():
+                print(line)
+
+        # Package versions
+        print()
+        print("Package Versions:")
+        for probe in packages:
+            for line in probe.result():
+                print(line)
 
 
 def main() -> int:
@@ -296,6 +708,8 @@ Examples:
     print("║            代書 Log Checker & Diagnostics                ║")
     print("╚══════════════════════════════════════════════════════════╝")
 
+    detect_level_slice(get_log_path())
+
     # If no specific option, show health summary
     if not any([args.errors, args.warnings, args.tail, args.system, args.all]):
         show_log_health()
@@ -307,12 +721,29 @@ Examples:
         show_system_diagnostics()
 
     if args.all:
-        show_log_health()
+        # Gather every section from a single pass over the log
+        log_path = get_log_path()
+        counts = errors = warnings = tail = None
+        if os.path.exists(log_path):
+            try:
+                counts, errors, warnings, tail = scan_log(
+                    log_path, args.count, args.tail or 0
+                )
+            except Exception as e:
+                print(f"Error reading log file: {e}")
+
+        show_log_health(counts)
+        show_recent_errors(args.count, errors)
+        show_recent_warnings(args.count, warnings)
+        if args.tail:
+            show_tail(args.tail, tail)
+        print()
+        return 0
 
-    if args.all or args.errors:
+    if args.errors:
         show_recent_errors(args.count)
 
-    if args.all or args.warnings:
+    if args.warnings:
         show_recent_warnings(args.count)
 
     if args.tail:
@@ -28,6 +28,7 @@ Requirements:
 
 import sys
 import os
+import importlib.util
 
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -48,10 +49,19 @@ def check_dependencies() -> list[str]:
         ("manga_ocr", "manga-ocr"),
     ]
 
+    # find_spec locates a module without executing it, so heavy packages
+    # (Qt binaries, torch via manga_ocr) are only loaded when actually used
     for import_name, package_name in required:
         try:
-            __import__(import_name)
-        except ImportError:
+            found = importlib.util.find_spec(import_name) is not None
+        except (ImportError, ValueError):
+            # Spec lookup failed (e.g. a broken __spec__); fall back to importing
+            try:
+                __import__(import_name)
+                found = True
+            except ImportError:
+                found = False
+        if not found:
             missing.append(package_name)
 
     return missing
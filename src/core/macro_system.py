@@ -7,15 +7,24 @@ in manga readers after OCR capture.
 """
 
 from __future__ import annotations
+import math
 import time
 import threading
-from dataclasses import dataclass, field
-from enum import Enum, auto
+from dataclasses import dataclass
+from enum import Enum, IntEnum, auto
 from typing import List, Optional, Callable, Any
+from collections.abc import Sequence
 import json
 
+# Optional faster JSON encoder for event dumps
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-class EventType(Enum):
+
+class EventType(IntEnum):
     """Types of input events."""
     KEY_DOWN = auto()
     KEY_UP = auto()
@@ -24,33 +33,85 @@ class EventType(Enum):
     MOUSE_UP = auto()
     MOUSE_MOVE = auto()
     MOUSE_SCROLL = auto()
+    TEXT_TYPE = auto()  # Synthetic: a coalesced typing run, replayed in one write
+
+
+# Payload fields used by each event type (serialized under "data")
+_EVENT_FIELDS: dict[EventType, tuple[str, ...]] = {
+    EventType.KEY_DOWN: ("key", "scan_code"),
+    EventType.KEY_UP: ("key", "scan_code"),
+    EventType.MOUSE_CLICK: ("button", "x", "y"),
+    EventType.MOUSE_DOWN: ("button", "x", "y"),
+    EventType.MOUSE_UP: ("button", "x", "y"),
+    EventType.MOUSE_MOVE: ("x", "y"),
+    EventType.MOUSE_SCROLL: ("delta",),
+    EventType.TEXT_TYPE: ("key",),
+}
 
+# Max gap between keystrokes (and within a press/release pair) for them
+# to be merged into a single TEXT_TYPE event at playback
+TYPING_RUN_GAP = 0.03  # seconds
+TYPING_RUN_MIN_CHARS = 2
 
-@dataclass
+
+@dataclass(slots=True)
 class InputEvent:
-    """Represents a single input event."""
+    """
+    Represents a single input event.
+
+    Payload fields are stored as slots rather than a per-event dict;
+    each event type only uses the fields listed in _EVENT_FIELDS.
+    """
     event_type: EventType
     timestamp: float  # Relative to recording start
-    data: dict = field(default_factory=dict)
+    key: str = ""
+    scan_code: int = 0
+    x: int = 0
+    y: int = 0
+    button: str = "left"
+    delta: float = 0.0
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
             "event_type": self.event_type.name,
             "timestamp": self.timestamp,
-            "data": self.data
+            "data": {name: getattr(self, name) for name in _EVENT_FIELDS[self.event_type]}
         }
 
     @classmethod
     def from_dict(cls, d: dict) -> InputEvent:
         """Create from dictionary."""
+        event_type = EventType[d["event_type"]]
+        data = d.get("data", {})
         return cls(
-            event_type=EventType[d["event_type"]],
-            timestamp=d["timestamp"],
-            data=d.get("data", {})
+            event_type,
+            d["timestamp"],
+            **{name: data[name] for name in _EVENT_FIELDS[event_type] if name in data}
         )
 
 
+class _ReadOnlyList(Sequence):
+    """Read-only, non-copying view over a list."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: list) -> None:
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
+
+
 class MacroState(Enum):
     """State of the macro system."""
     IDLE = auto()
@@ -70,10 +131,18 @@ class MacroManager:
         """Initialize the macro manager."""
         self._state = MacroState.IDLE
         self._events: List[InputEvent] = []
-        self._start_time: float = 0.0
+        self._start_time: float = 0.0  # time.monotonic() at recording start
         self._kill_key: str = "f12"
         self._kill_requested = False
 
+        # Mouse move downsampling: a move is only recorded once the pointer
+        # has been still for this long or travelled this far
+        self._min_move_interval: float = 0.008  # seconds
+        self._min_move_distance: float = 4.0  # pixels
+        self._last_move_ts: float = 0.0
+        self._last_move_xy: Optional[tuple[int, int]] = None
+        self._pending_move: Optional[InputEvent] = None
+
         # Callbacks
         self._on_recording_complete: Optional[Callable[[List[InputEvent]], None]] = None
         self._on_playback_complete: Optional[Callable[[], None]] = None
@@ -85,18 +154,28 @@ class MacroManager:
         # Check for available libraries
         self._keyboard_available = False
         self._mouse_available = False
+        self._kb: Any = None  # keyboard module, once imported
+        self._ms: Any = None  # mouse module, once imported
         self._check_libraries()
 
+        # Keyboard hooks: the kill key stays registered for the manager's
+        # lifetime and is gated on state; the recorder only exists while recording
+        self._kill_hook: Any = None
+        self._record_hook: Any = None
+        self._register_kill_key()
+
     def _check_libraries(self) -> None:
         """Check which input libraries are available."""
         try:
             import keyboard
+            self._kb = keyboard
             self._keyboard_available = True
         except (ImportError, OSError) as e:
             print(f"Warning: keyboard library not available: {e}")
 
         try:
             import mouse
+            self._ms = mouse
             self._mouse_available = True
         except (ImportError, OSError) as e:
             print(f"Warning: mouse library not available: {e}")
@@ -108,9 +187,14 @@ class MacroManager:
 
     @property
     def events(self) -> List[InputEvent]:
-        """Get recorded events."""
+        """Get a copy of the recorded events (prefer events_view for reading)."""
         return self._events.copy()
 
+    @property
+    def events_view(self) -> Sequence[InputEvent]:
+        """Get a read-only view of the recorded events without copying them."""
+        return _ReadOnlyList(self._events)
+
     @property
     def is_available(self) -> bool:
         """Check if macro system is available."""
@@ -118,7 +202,42 @@ class MacroManager:
 
     def set_kill_key(self, key: str) -> None:
         """Set the key that stops playback."""
+        if key == self._kill_key and self._kill_hook is not None:
+            return
         self._kill_key = key
+        self._register_kill_key()
+
+    def _register_kill_key(self) -> None:
+        """(Re)bind the persistent kill key hook to the current kill key."""
+        if not self._keyboard_available:
+            return
+
+        if self._kill_hook is not None:
+            try:
+                self._kb.unhook(self._kill_hook)
+            except Exception:
+                pass
+            self._kill_hook = None
+
+        try:
+            self._kill_hook = self._kb.on_press_key(self._kill_key, self._on_kill_key)
+        except Exception as e:
+            print(f"Failed to set up kill key: {e}")
+
+    def set_move_sampling(self, min_ms: float, min_px: float) -> None:
+        """
+        Set how aggressively mouse moves are downsampled while recording.
+
+        A move is dropped if it arrives within min_ms of the last recorded
+        move and is closer than min_px to it. Pass 0 for both to record
+        every move.
+
+        Args:
+            min_ms: Minimum time between recorded moves, in milliseconds
+            min_px: Minimum pointer travel between recorded moves, in pixels
+        """
+        self._min_move_interval = max(0.0, min_ms) / 1000.0
+        self._min_move_distance = max(0.0, min_px)
 
     def set_callbacks(
         self,
@@ -153,22 +272,24 @@ class MacroManager:
             return False
 
         self._events.clear()
-        self._start_time = time.time()
+        self._last_move_ts = 0.0
+        self._last_move_xy = None
+        self._pending_move = None
+        self._start_time = time.monotonic()
         self._set_state(MacroState.RECORDING)
 
-        # Hook keyboard events
+        # Hook keyboard events; the kill key is handled by its own
+        # persistent hook so the recorder itself stays a plain append
         if self._keyboard_available:
             try:
-                import keyboard
-                keyboard.hook(self._on_keyboard_event)
+                self._record_hook = self._kb.hook(self._make_keyboard_recorder())
             except Exception as e:
                 print(f"Failed to hook keyboard: {e}")
 
         # Hook mouse events
         if self._mouse_available:
             try:
-                import mouse
-                mouse.hook(self._on_mouse_event)
+                self._ms.hook(self._on_mouse_event)
             except Exception as e:
                 print(f"Failed to hook mouse: {e}")
 
@@ -185,21 +306,23 @@ class MacroManager:
         if self._state != MacroState.RECORDING:
             return self._events
 
-        # Unhook events
-        if self._keyboard_available:
+        # Unhook events (leaving the kill key hook in place)
+        if self._record_hook is not None:
             try:
-                import keyboard
-                keyboard.unhook_all()
+                self._kb.unhook(self._record_hook)
             except Exception:
                 pass
+            self._record_hook = None
 
         if self._mouse_available:
             try:
-                import mouse
-                mouse.unhook_all()
+                self._ms.unhook_all()
             except Exception:
                 pass
 
+        # Keep the final pointer position even if its move was sampled out
+        self._flush_pending_move()
+
         self._set_state(MacroState.IDLE)
         print(f"Recording stopped. {len(self._events)} events captured.")
 
@@ -208,37 +331,50 @@ class MacroManager:
 
         return self._events
 
-    def _on_keyboard_event(self, event) -> None:
-        """Handle keyboard events during recording."""
-        if self._state != MacroState.RECORDING:
-            return
+    def _make_keyboard_recorder(self) -> Callable[[Any], None]:
+        """
+        Build the keyboard hook used while recording.
 
-        # Check for kill key
-        if event.name == self._kill_key and event.event_type == "down":
-            self.stop_recording()
-            return
+        Everything the hook needs is bound as a default argument, so each
+        keypress costs a few local lookups and one list append. The hook
+        is removed in stop_recording() before the state leaves RECORDING.
+        """
+        def record(
+            event,
+            _append=self._events.append,
+            _now=time.monotonic,
+            _t0=self._start_time,
+            _kill_key=self._kill_key,
+            _key_down=EventType.KEY_DOWN,
+            _key_up=EventType.KEY_UP,
+        ) -> None:
+            # Kill key presses are handled by _on_kill_key
+            if event.name == _kill_key:
+                return
+            _append(InputEvent(
+                _key_down if event.event_type == "down" else _key_up,
+                _now() - _t0,
+                key=event.name,
+                scan_code=event.scan_code
+            ))
 
-        # Record event
-        event_type = EventType.KEY_DOWN if event.event_type == "down" else EventType.KEY_UP
-        timestamp = time.time() - self._start_time
+        return record
 
-        self._events.append(InputEvent(
-            event_type=event_type,
-            timestamp=timestamp,
-            data={"key": event.name, "scan_code": event.scan_code}
-        ))
 
     def _on_mouse_event(self, event) -> None:
         """Handle mouse events during recording."""
         if self._state != MacroState.RECORDING:
             return
 
-        timestamp = time.time() - self._start_time
+        timestamp = time.monotonic() - self._start_time
 
         # Determine event type
         event_name = type(event).__name__
 
         if event_name == "ButtonEvent":
+            # Make sure the pointer is where the click happened
+            self._flush_pending_move()
+
             if event.event_type == "down":
                 event_type = EventType.MOUSE_DOWN
             elif event.event_type == "up":
@@ -249,23 +385,55 @@ class MacroManager:
             self._events.append(InputEvent(
                 event_type=event_type,
                 timestamp=timestamp,
-                data={"button": event.button, "x": event.x, "y": event.y}
+                button=event.button,
+                x=event.x,
+                y=event.y
             ))
 
         elif event_name == "MoveEvent":
-            self._events.append(InputEvent(
+            move = InputEvent(
                 event_type=EventType.MOUSE_MOVE,
                 timestamp=timestamp,
-                data={"x": event.x, "y": event.y}
-            ))
+                x=event.x,
+                y=event.y
+            )
+            if self._last_move_xy is not None:
+                last_x, last_y = self._last_move_xy
+                distance = math.hypot(event.x - last_x, event.y - last_y)
+
+                # Collapse repeats of the last recorded position
+                if distance == 0:
+                    self._pending_move = None
+                    return
+
+                # Sample dense motion, remembering where the pointer ended up
+                if (timestamp - self._last_move_ts < self._min_move_interval
+                        and distance < self._min_move_distance):
+                    self._pending_move = move
+                    return
+
+            self._record_move(move)
 
         elif event_name == "WheelEvent":
+            self._flush_pending_move()
             self._events.append(InputEvent(
                 event_type=EventType.MOUSE_SCROLL,
                 timestamp=timestamp,
-                data={"delta": event.delta}
+                delta=event.delta
             ))
 
+    def _record_move(self, move: InputEvent) -> None:
+        """Append a mouse move and make it the reference for sampling."""
+        self._events.append(move)
+        self._last_move_ts = move.timestamp
+        self._last_move_xy = (move.x, move.y)
+        self._pending_move = None
+
+    def _flush_pending_move(self) -> None:
+        """Record the most recent sampled-out move, if any."""
+        if self._pending_move is not None:
+            self._record_move(self._pending_move)
+
     def play(self, events: Optional[List[InputEvent]] = None) -> bool:
         """
         Play back recorded events in a background thread.
@@ -285,17 +453,12 @@ class MacroManager:
             print("No events to play")
             return False
 
+        if self._keyboard_available:
+            events_to_play = self._coalesce_typing_runs(events_to_play)
+
         self._kill_requested = False
         self._set_state(MacroState.PLAYING)
 
-        # Set up kill key listener
-        if self._keyboard_available:
-            try:
-                import keyboard
-                keyboard.on_press(self._on_kill_key, suppress=False)
-            except Exception as e:
-                print(f"Failed to set up kill key: {e}")
-
         # Start playback thread
         self._playback_thread = threading.Thread(
             target=self._playback_worker,
@@ -306,23 +469,79 @@ class MacroManager:
 
         return True
 
+    @staticmethod
+    def _coalesce_typing_runs(events: Sequence[InputEvent]) -> List[InputEvent]:
+        """
+        Merge tight runs of printable keystrokes into TEXT_TYPE events.
+
+        A run is a sequence of KEY_DOWN/KEY_UP pairs on single printable
+        characters, each within TYPING_RUN_GAP of the previous one, typed
+        while no other key is held (so modifier combos replay unchanged).
+
+        Args:
+            events: Events to play
+
+        Returns:
+            New event list; the input is not modified
+        """
+        result: List[InputEvent] = []
+        held: set[str] = set()
+        i, n = 0, len(events)
+
+        while i < n:
+            event = events[i]
+
+            if not held:
+                chars: List[str] = []
+                j = i
+                last_ts = event.timestamp
+                while j + 1 < n:
+                    down, up = events[j], events[j + 1]
+                    if not (down.event_type is EventType.KEY_DOWN
+                            and up.event_type is EventType.KEY_UP
+                            and down.key == up.key
+                            and len(down.key) == 1
+                            and down.key.isprintable()):
+                        break
+                    if (down.timestamp - last_ts > TYPING_RUN_GAP
+                            or up.timestamp - down.timestamp > TYPING_RUN_GAP):
+                        break
+                    chars.append(down.key)
+                    last_ts = up.timestamp
+                    j += 2
+
+                if len(chars) >= TYPING_RUN_MIN_CHARS:
+                    result.append(InputEvent(EventType.TEXT_TYPE, event.timestamp, key="".join(chars)))
+                    i = j
+                    continue
+
+            if event.event_type is EventType.KEY_DOWN:
+                held.add(event.key)
+            elif event.event_type is EventType.KEY_UP:
+                held.discard(event.key)
+            result.append(event)
+            i += 1
+
+        return result
+
     def _on_kill_key(self, event) -> None:
-        """Handle kill key press during playback."""
-        if self._state == MacroState.PLAYING and event.name == self._kill_key:
+        """Handle kill key press: stops playback or recording, ignored when idle."""
+        state = self._state
+        if state is MacroState.PLAYING:
             self._kill_requested = True
             print("Kill key pressed, stopping playback...")
+        elif state is MacroState.RECORDING:
+            self.stop_recording()
 
     def _playback_worker(self, events: List[InputEvent]) -> None:
         """Worker thread for event playback."""
-        try:
-            import keyboard
-            import mouse
-        except ImportError:
+        if self._kb is None or self._ms is None:
             self._set_state(MacroState.IDLE)
             return
 
         print(f"Playing {len(events)} events...")
-        prev_timestamp = 0.0
+        # Schedule against absolute deadlines so sleep overshoot doesn't accumulate
+        start_ns = time.monotonic_ns()
 
         for event in events:
             if self._kill_requested:
@@ -330,10 +549,9 @@ class MacroManager:
                 break
 
             # Wait for correct timing
-            delay = event.timestamp - prev_timestamp
+            delay = event.timestamp - (time.monotonic_ns() - start_ns) / 1e9
             if delay > 0:
                 time.sleep(delay)
-            prev_timestamp = event.timestamp
 
             if self._kill_requested:
                 break
@@ -344,13 +562,6 @@ class MacroManager:
             except Exception as e:
                 print(f"Error executing event: {e}")
 
-        # Cleanup
-        if self._keyboard_available:
-            try:
-                keyboard.unhook(self._on_kill_key)
-            except Exception:
-                pass
-
         self._set_state(MacroState.IDLE)
         print("Playback complete")
 
@@ -359,29 +570,23 @@ class MacroManager:
 
     def _execute_event(self, event: InputEvent) -> None:
         """Execute a single input event."""
-        import keyboard
-        import mouse
-
-        if event.event_type == EventType.KEY_DOWN:
-            keyboard.press(event.data["key"])
-
-        elif event.event_type == EventType.KEY_UP:
-            keyboard.release(event.data["key"])
-
-        elif event.event_type == EventType.MOUSE_DOWN:
-            mouse.press(event.data.get("button", "left"))
-
-        elif event.event_type == EventType.MOUSE_UP:
-            mouse.release(event.data.get("button", "left"))
-
-        elif event.event_type == EventType.MOUSE_CLICK:
-            mouse.click(event.data.get("button", "left"))
-
-        elif event.event_type == EventType.MOUSE_MOVE:
-            mouse.move(event.data["x"], event.data["y"])
-
-        elif event.event_type == EventType.MOUSE_SCROLL:
-            mouse.wheel(event.data["delta"])
+        match event.event_type:
+            case EventType.MOUSE_MOVE:
+                self._ms.move(event.x, event.y)
+            case EventType.KEY_DOWN:
+                self._kb.press(event.key)
+            case EventType.KEY_UP:
+                self._kb.release(event.key)
+            case EventType.MOUSE_DOWN:
+                self._ms.press(event.button)
+            case EventType.MOUSE_UP:
+                self._ms.release(event.button)
+            case EventType.MOUSE_CLICK:
+                self._ms.click(event.button)
+            case EventType.MOUSE_SCROLL:
+                self._ms.wheel(event.delta)
+            case EventType.TEXT_TYPE:
+                self._kb.write(event.key)
 
     def stop(self) -> None:
         """Stop any ongoing operation."""
@@ -398,6 +603,29 @@ class MacroManager:
         """Save events to serializable format."""
         return [e.to_dict() for e in self._events]
 
+    def dump_events(self, path: str) -> None:
+        """
+        Write events to a JSON file, one event at a time.
+
+        Produces the same list as save_events() but streams it, so long
+        recordings are never held in memory as a list of dicts.
+
+        Args:
+            path: Destination file path
+        """
+        encoder = None if ORJSON_AVAILABLE else json.JSONEncoder(ensure_ascii=False)
+
+        with open(path, "wb") as f:
+            f.write(b"[")
+            for i, event in enumerate(self._events):
+                if i:
+                    f.write(b",")
+                if encoder is None:
+                    f.write(orjson.dumps(event.to_dict()))
+                else:
+                    f.write(encoder.encode(event.to_dict()).encode("utf-8"))
+            f.write(b"]")
+
     def clear_events(self) -> None:
         """Clear recorded events."""
         self._events.clear()
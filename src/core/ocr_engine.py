@@ -1,46 +1,70 @@
 """
-OCR Engine Wrapper - Singleton pattern for manga-ocr model management.
+OCR Engine Wrapper - Shared instance for manga-ocr model management.
 
-This module provides a thread-safe singleton wrapper around the manga-ocr library,
+This module provides a thread-safe shared wrapper around the manga-ocr library,
 handling model loading, GPU/CPU fallback, and image processing.
 """
 
 from __future__ import annotations
+import contextlib
+import importlib.util
+import os
+import platform
+import queue
 import threading
-from typing import Optional, Callable, TYPE_CHECKING
+from concurrent.futures import Future
+from typing import Optional, Callable, List, TYPE_CHECKING
 from PIL import Image
+import numpy as np
 
 from ..utils.logger import log_info, log_error, log_debug, log_warning
 
 if TYPE_CHECKING:
     from manga_ocr import MangaOcr
 
+# Bound fragmentation of PyTorch's CUDA caching allocator across captures of
+# varying size. The allocator reads this on its first CUDA allocation, so it
+# only needs to be set before the model is loaded; user settings take priority.
+_CUDA_ALLOC_CONF = "max_split_size_mb:128,garbage_collection_threshold:0.8"
+if platform.system() != "Windows":
+    # Expandable segments are not supported on Windows builds
+    _CUDA_ALLOC_CONF += ",expandable_segments:True"
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", _CUDA_ALLOC_CONF)
+
+# Batch size used to warm up batched inference after loading
+BATCH_WARMUP_SIZE = 2
+
+# Pending requests held for the OCR worker; older ones are dropped when full
+OCR_QUEUE_SIZE = 2
+
+# How long the worker waits for more requests to batch with the first one
+OCR_BATCH_WAIT = 0.005
+
 
 class MangaOCRWrapper:
     """
-    Singleton wrapper for manga-ocr model to manage heavy model loading.
+    Wrapper for manga-ocr model to manage heavy model loading.
 
     The model is loaded once and reused across all OCR operations.
-    Thread-safe initialization ensures only one model instance exists.
+    Use get_ocr_engine() to obtain the shared instance.
+
+    GPU memory behaviour is tuned through PYTORCH_CUDA_ALLOC_CONF (set by
+    this module unless already defined) and set_memory_fraction().
     """
 
-    _instance: Optional[MangaOCRWrapper] = None
-    _lock = threading.Lock()
-    _initialized = False
-
-    def __new__(cls) -> MangaOCRWrapper:
-        """Thread-safe singleton pattern."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize the OCR wrapper (only runs once due to singleton)."""
-        if MangaOCRWrapper._initialized:
-            return
+    # MangaOcr class, imported on first load and reused for reloads
+    _MangaOcrCls = None
 
+    def __init__(self, use_fp16: bool = True, compile_encoder: bool = True, warmup: bool = True) -> None:
+        """
+        Initialize the OCR wrapper.
+
+        Args:
+            use_fp16: Run the model in half precision when on GPU
+            compile_encoder: Compile the encoder with torch.compile when on GPU
+            warmup: Run dummy inferences while loading so the first real
+                capture doesn't pay for CUDA/cuDNN initialization
+        """
         self._mocr: Optional[MangaOcr] = None
         self._is_loaded = False
         self._is_loading = False
@@ -48,8 +72,20 @@ class MangaOCRWrapper:
         self._load_lock = threading.Lock()
         self._load_event = threading.Event()
         self._use_gpu = False
-
-        MangaOCRWrapper._initialized = True
+        self._use_fp16 = use_fp16
+        self._fp16_active = False
+        self._channels_last = False
+        self._compile_encoder = compile_encoder
+        self._warmup = warmup
+        self._infer_lock = threading.Lock()
+        self._pinned_buf = None  # Reusable pinned host buffer for GPU uploads
+        self._torch = None  # torch module, cached on load
+        self._gpu_norm = None  # (gain, bias) device tensors for on-GPU normalization
+        self._input_size = (0, 0)  # Processor output size as (width, height)
+        self._resample = Image.BILINEAR
+        self._in_q: queue.Queue = queue.Queue(maxsize=OCR_QUEUE_SIZE)
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
 
     @property
     def is_loaded(self) -> bool:
@@ -71,6 +107,34 @@ class MangaOCRWrapper:
         """Check if the model is using GPU acceleration."""
         return self._use_gpu
 
+    @property
+    def uses_fp16(self) -> bool:
+        """Check if the model is running in half precision."""
+        return self._fp16_active
+
+    def set_memory_fraction(self, fraction: float) -> bool:
+        """
+        Cap the share of GPU memory PyTorch may allocate in this process.
+
+        Useful when the OCR model has to coexist with other GPU apps.
+
+        Args:
+            fraction: Fraction of total device memory, in (0, 1]
+
+        Returns:
+            True if the limit was applied
+        """
+        try:
+            import torch
+            if not torch.cuda.is_available():
+                return False
+            torch.cuda.set_per_process_memory_fraction(fraction)
+            log_info(f"GPU memory fraction limited to {fraction:.0%}")
+            return True
+        except Exception as e:
+            log_warning(f"Could not set GPU memory fraction: {e}")
+            return False
+
     def load_model_async(self, callback: Optional[Callable[[bool, Optional[str]], None]] = None) -> None:
         """
         Load the manga-ocr model in a background thread.
@@ -109,6 +173,7 @@ class MangaOCRWrapper:
                 # Check for GPU availability
                 try:
                     import torch
+                    self._torch = torch
                     log_debug("Checking PyTorch GPU support...")
                     if torch.cuda.is_available():
                         self._use_gpu = True
@@ -119,11 +184,41 @@ class MangaOCRWrapper:
                     log_warning("PyTorch not found for GPU check")
 
                 # Load the model
-                log_debug("Importing manga_ocr module...")
-                from manga_ocr import MangaOcr
+                if MangaOCRWrapper._MangaOcrCls is None:
+                    if importlib.util.find_spec("manga_ocr") is None:
+                        raise ImportError("No module named 'manga_ocr'")
+                    log_debug("Importing manga_ocr module...")
+                    from manga_ocr import MangaOcr
+                    MangaOCRWrapper._MangaOcrCls = MangaOcr
 
                 log_info("Initializing manga-ocr model (downloading if needed)...")
-                self._mocr = MangaOcr()
+                self._mocr = MangaOCRWrapper._MangaOcrCls()
+
+                # Half precision on GPU; CPU inference stays FP32
+                if self._use_gpu and self._use_fp16:
+                    try:
+                        self._mocr.model.half().eval()
+                        self._fp16_active = True
+                        log_info("Using FP16 inference")
+                    except Exception as e:
+                        log_warning(f"FP16 conversion failed, using FP32: {e}")
+
+                # NHWC lets cuDNN pick tensor-core kernels for the patch embedding
+                if self._fp16_active:
+                    try:
+                        self._mocr.model.to(memory_format=torch.channels_last)
+                        self._channels_last = True
+                    except Exception as e:
+                        log_debug(f"channels_last conversion skipped: {e}")
+
+                if self._use_gpu:
+                    self._cache_gpu_normalization()
+
+                if self._use_gpu and self._compile_encoder:
+                    self._compile_model_encoder()
+
+                if self._warmup:
+                    self._warm_up()
 
                 self._is_loaded = True
                 log_info("manga-ocr model loaded successfully!")
@@ -149,7 +244,6 @@ class MangaOCRWrapper:
                 log_error(f"Runtime error: {e}")
 
             except Exception as e:
-                import platform
                 if platform.system() == "Windows" and ("DLL" in str(e) or "WinError" in str(e)):
                     self._load_error = (
                         "A required system library is missing.\n\n"
@@ -167,6 +261,84 @@ class MangaOCRWrapper:
                 self._is_loading = False
                 self._load_event.set()
 
+    def _warm_up(self) -> None:
+        """
+        Run dummy inferences through our own pipeline on the loading thread.
+
+        MangaOcr's built-in warmup goes through its __call__, not
+        _infer_batch(), so this covers the single-image path the GUI uses
+        and a small batch for batched calls.
+        """
+        dummy = Image.new('RGB', (224, 224), 'white')
+        for batch_size in (1, BATCH_WARMUP_SIZE):
+            try:
+                self._infer_batch([dummy] * batch_size)
+            except Exception as e:
+                log_warning(f"Warmup with batch size {batch_size} failed: {e}")
+                return
+        log_debug("manga-ocr warmup complete")
+
+    def _cache_gpu_normalization(self) -> None:
+        """
+        Cache the processor's normalization as device tensors.
+
+        With these set, _infer_batch() only resizes on the CPU and uploads
+        the grayscale uint8 plane; rescaling and mean/std normalization run
+        on the GPU as a single fused multiply-add. Falls back to the
+        processor's own CPU pipeline if its settings can't be read.
+        """
+        torch = self._torch
+        processor = self._processor()
+        try:
+            if not getattr(processor, "do_resize", True) or not getattr(processor, "do_normalize", True):
+                return
+            size = processor.size
+            if isinstance(size, dict):
+                width, height = size["width"], size["height"]
+            else:
+                width = height = int(size)
+            scale = getattr(processor, "rescale_factor", 1 / 255) if getattr(processor, "do_rescale", True) else 1.0
+            device = self._mocr.model.device
+            mean = torch.tensor(processor.image_mean, dtype=torch.float32, device=device).view(1, 3, 1, 1)
+            std = torch.tensor(processor.image_std, dtype=torch.float32, device=device).view(1, 3, 1, 1)
+        except Exception as e:
+            log_debug(f"Using CPU preprocessing: {e}")
+            return
+
+        # (x * scale - mean) / std  ==  x * gain + bias
+        self._gpu_norm = (scale / std, -mean / std)
+        self._input_size = (width, height)
+        self._resample = getattr(processor, "resample", Image.BILINEAR)
+        log_debug(f"Normalizing {width}x{height} inputs on GPU")
+
+    def _compile_model_encoder(self) -> None:
+        """
+        Replace the encoder with a torch.compile'd version.
+
+        Inputs always have the processor's fixed size, so the compiled
+        graph (and its CUDA graph) is reused for every capture. Compilation
+        happens on first use, so it is triggered here on the loading thread;
+        on any failure (PyTorch < 2.0, no Triton, ...) the eager encoder
+        is restored.
+        """
+        torch = self._torch
+
+        if not hasattr(torch, "compile"):
+            log_debug("torch.compile not available (PyTorch < 2.0)")
+            return
+
+        model = self._mocr.model
+        eager_encoder = model.encoder
+        try:
+            model.encoder = torch.compile(eager_encoder, mode="reduce-overhead", fullgraph=False)
+            dummy = [Image.new('RGB', (224, 224), 'white')]
+            for _ in range(2):
+                self._infer_batch(dummy)
+            log_info("manga-ocr encoder compiled with torch.compile")
+        except Exception as e:
+            model.encoder = eager_encoder
+            log_warning(f"torch.compile failed, using eager encoder: {e}")
+
     def wait_for_load(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for the model to finish loading.
@@ -177,6 +349,9 @@ class MangaOCRWrapper:
         Returns:
             True if model loaded successfully, False otherwise
         """
+        # Fast path: is_set() doesn't take the event's condition lock
+        if self._load_event.is_set():
+            return self._is_loaded
         self._load_event.wait(timeout)
         return self._is_loaded
 
@@ -193,6 +368,201 @@ class MangaOCRWrapper:
         Raises:
             RuntimeError: If model is not loaded
         """
+        self._check_ready()
+
+        try:
+            # Same pipeline as MangaOcr.__call__, but with our own host->device upload
+            return self._infer_batch([image])[0]
+
+        except RuntimeError as e:
+            self._raise_inference_error(e)
+
+    def perform_ocr_async(self, image: Image.Image) -> Future:
+        """
+        Queue a PIL Image for OCR on the persistent worker thread.
+
+        Requests that arrive together are run as one batch. At most
+        OCR_QUEUE_SIZE requests wait at a time; when a new one arrives on a
+        full queue the oldest waiting request is dropped and its future
+        cancelled, so rapid repeated captures only process the latest ones.
+
+        Args:
+            image: PIL Image to process (should be preprocessed)
+
+        Returns:
+            Future resolving to the extracted text, or to the same
+            RuntimeError perform_ocr() would raise
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        while True:
+            try:
+                self._in_q.put_nowait((image, future))
+                return future
+            except queue.Full:
+                try:
+                    _, stale = self._in_q.get_nowait()
+                except queue.Empty:
+                    continue
+                stale.cancel()
+                log_debug("Dropped stale OCR request")
+
+    def _ensure_worker(self) -> None:
+        """Start the OCR worker thread if it isn't running yet."""
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._worker_loop, name="ocr-worker", daemon=True)
+                self._worker.start()
+
+    def _worker_loop(self) -> None:
+        """Run queued OCR requests, batching those that arrive together."""
+        while True:
+            pending = [self._in_q.get()]
+            while len(pending) < OCR_QUEUE_SIZE:
+                try:
+                    pending.append(self._in_q.get(timeout=OCR_BATCH_WAIT))
+                except queue.Empty:
+                    break
+
+            # Skip requests whose caller already gave up on them
+            pending = [(image, future) for image, future in pending
+                       if future.set_running_or_notify_cancel()]
+            if not pending:
+                continue
+
+            try:
+                self._check_ready()
+                try:
+                    texts = self._infer_batch([image for image, _ in pending])
+                except RuntimeError as e:
+                    self._raise_inference_error(e)
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+            else:
+                for (_, future), text in zip(pending, texts):
+                    future.set_result(text)
+
+    def perform_ocr_batch(self, images: List[Image.Image]) -> List[str]:
+        """
+        Perform OCR on several PIL Images in one model pass.
+
+        All images are stacked into a single (N, 3, H, W) batch, encoded
+        in one forward pass and decoded with one generate() call, which
+        amortizes launch overhead on GPU. Use perform_ocr() for a single
+        image.
+
+        Args:
+            images: PIL Images to process (should be preprocessed)
+
+        Returns:
+            Extracted text for each image, in input order
+
+        Raises:
+            RuntimeError: If model is not loaded
+        """
+        self._check_ready()
+        if not images:
+            return []
+
+        try:
+            return self._infer_batch(images)
+        except RuntimeError as e:
+            self._raise_inference_error(e)
+
+    def _infer_batch(self, images: List[Image.Image]) -> List[str]:
+        """Run batched inference on the loaded model (no readiness checks)."""
+        from manga_ocr.ocr import post_process
+
+        mocr = self._mocr
+        gpu_norm = self._gpu_norm
+
+        # Match MangaOcr.__call__, which feeds grayscale expanded back to RGB;
+        # the processor resizes every image to the same size, so no padding is needed
+        if gpu_norm is None:
+            prepared = [image.convert('L').convert('RGB') for image in images]
+            pixel_values = self._processor()(prepared, return_tensors="pt").pixel_values
+        else:
+            # The three RGB channels would be identical, so resize and upload
+            # only the grayscale plane and let the normalization broadcast it
+            gray = np.stack([
+                np.asarray(image.convert('L').resize(self._input_size, self._resample))
+                for image in images
+            ])
+            pixel_values = self._torch.from_numpy(gray)
+
+        with self._infer_lock:
+            if gpu_norm is None:
+                pixel_values = self._upload(pixel_values)
+            else:
+                gain, bias = gpu_norm
+                gray = self._upload(pixel_values, dtype=self._torch.float32).unsqueeze(1)
+                pixel_values = self._torch.addcmul(bias, gray, gain).to(mocr.model.dtype)
+            if self._channels_last:
+                pixel_values = pixel_values.contiguous(memory_format=self._torch.channels_last)
+            with self._inference_context():
+                output = mocr.model.generate(pixel_values, max_length=300)
+            # .cpu() synchronizes, so the staging buffer is free again afterwards
+            output = output.cpu()
+
+        texts = mocr.tokenizer.batch_decode(output, skip_special_tokens=True)
+        return [post_process(text).strip() for text in texts]
+
+    def _processor(self):
+        """Get the loaded model's image processor."""
+        # Newer manga-ocr releases renamed feature_extractor to processor
+        return getattr(self._mocr, "processor", None) or self._mocr.feature_extractor
+
+    def _upload(self, pixel_values, dtype=None):
+        """
+        Move a batch of pixel values to the model's device.
+
+        The batch is cast to dtype on the device, defaulting to the
+        model's dtype.
+
+        On GPU the batch is copied through a pinned host buffer that is
+        allocated once and grown only when a larger batch arrives, so each
+        call avoids a fresh pageable allocation and gets a faster,
+        asynchronous host-to-device copy. Must be called under _infer_lock.
+        """
+        model = self._mocr.model
+        dtype = dtype or model.dtype
+        if not self._use_gpu:
+            return pixel_values.to(model.device, dtype=dtype)
+
+        torch = self._torch
+
+        n = pixel_values.shape[0]
+        buf = self._pinned_buf
+        if (buf is None or buf.shape[0] < n
+                or buf.shape[1:] != pixel_values.shape[1:]
+                or buf.dtype != pixel_values.dtype):
+            buf = torch.empty(pixel_values.shape, dtype=pixel_values.dtype, pin_memory=True)
+            self._pinned_buf = buf
+
+        staging = buf[:n]
+        staging.copy_(pixel_values)
+        return staging.to(model.device, dtype=dtype, non_blocking=True)
+
+    def _inference_context(self) -> contextlib.ExitStack:
+        """
+        Get the context for running inference.
+
+        Always disables autograd tracking via torch.inference_mode(), and
+        adds FP16 autocast when running in half precision on GPU.
+        """
+        torch = self._torch
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        if self._fp16_active:
+            stack.enter_context(torch.autocast(device_type='cuda', dtype=torch.float16))
+        return stack
+
+    def _check_ready(self) -> None:
+        """Raise RuntimeError unless the model is loaded."""
         if not self._is_loaded:
             if self._load_error:
                 raise RuntimeError(f"OCR model failed to load: {self._load_error}")
@@ -201,52 +571,67 @@ class MangaOCRWrapper:
         if self._mocr is None:
             raise RuntimeError("OCR model is None despite being marked as loaded")
 
-        try:
-            # Ensure image is RGB (manga-ocr requirement)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-
-            # Run inference
-            result = self._mocr(image)
-            return result.strip() if result else ""
-
-        except RuntimeError as e:
-            error_str = str(e)
-            # Handle CUDA out of memory
-            if "out of memory" in error_str.lower():
-                log_error("GPU out of memory during OCR inference")
-                raise RuntimeError(
-                    "GPU out of memory. Try:\n"
-                    "1. Close other GPU-intensive applications\n"
-                    "2. Use a smaller capture area\n"
-                    "3. Switch to CPU-only PyTorch"
-                )
-            raise
+    def _raise_inference_error(self, e: RuntimeError) -> None:
+        """Re-raise an inference error, translating CUDA out-of-memory."""
+        error_str = str(e)
+        # Handle CUDA out of memory
+        if "out of memory" in error_str.lower():
+            log_error("GPU out of memory during OCR inference")
+            raise RuntimeError(
+                "GPU out of memory. Try:\n"
+                "1. Close other GPU-intensive applications\n"
+                "2. Use a smaller capture area\n"
+                "3. Switch to CPU-only PyTorch"
+            )
+        raise e
+
+    def unload_model(self, release_gpu: bool = False) -> None:
+        """
+        Unload the model to free memory.
 
-    def unload_model(self) -> None:
-        """Unload the model to free memory."""
+        Args:
+            release_gpu: Also return PyTorch's cached GPU memory to the
+                driver. That synchronizes the device, so only ask for it
+                when another backend needs the memory (e.g. when switching
+                engines), not for a plain reload.
+        """
         with self._load_lock:
             if self._mocr is not None:
                 del self._mocr
                 self._mocr = None
 
+            self._fp16_active = False
+            self._channels_last = False
+            self._pinned_buf = None
+            self._gpu_norm = None
             self._is_loaded = False
             self._is_loading = False
             self._load_error = None
             self._load_event.clear()
 
-            # Try to free GPU memory
+        # Free cached GPU memory outside the lock; empty_cache() waits for the device
+        torch = self._torch
+        if release_gpu and torch is not None and torch.cuda.is_available():
             try:
-                import torch
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
+                torch.cuda.empty_cache()
             except Exception:
                 pass
 
-            log_info("manga-ocr model unloaded")
+        log_info("manga-ocr model unloaded")
+
+
+_ocr_engine: Optional[MangaOCRWrapper] = None
+_ocr_engine_lock = threading.Lock()
 
 
-# Convenience function to get the singleton instance
+# Convenience function to get the shared instance. The first construction
+# is serialised so concurrent callers share one wrapper; afterwards the
+# instance is returned without taking the lock.
 def get_ocr_engine() -> MangaOCRWrapper:
-    """Get the singleton OCR engine instance."""
-    return MangaOCRWrapper()
+    """Get the shared OCR engine instance."""
+    global _ocr_engine
+    if _ocr_engine is None:
+        with _ocr_engine_lock:
+            if _ocr_engine is None:
+                _ocr_engine = MangaOCRWrapper()
+    return _ocr_engine
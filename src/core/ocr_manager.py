@@ -6,12 +6,18 @@ OCR engines (manga-ocr, PaddleOCR) while providing a consistent interface.
 """
 
 from __future__ import annotations
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from enum import Enum
-from typing import Optional, Callable
-from PIL import Image
+from typing import Optional, Callable, List, Tuple, TYPE_CHECKING
 
 from ..utils.logger import log_info, log_error, log_debug
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 class OCREngine(Enum):
     """Available OCR engines."""
@@ -50,18 +56,42 @@ class OCRManager:
     and switching between different engines.
     """
 
-    def __init__(self) -> None:
-        """Initialize the OCR manager."""
+    def __init__(self, cache_size: int = 32, keep_engines_loaded: bool = False) -> None:
+        """
+        Initialize the OCR manager.
+
+        Args:
+            cache_size: Number of recent OCR results to keep, keyed by the
+                captured pixels, so repeated identical captures skip the
+                model. 0 disables the cache.
+            keep_engines_loaded: Keep an engine's model loaded after
+                switching away from it, so switching back is instant at the
+                cost of holding both models in memory.
+        """
         self._current_engine = OCREngine.MANGA_OCR
+        self._keep_engines_loaded = keep_engines_loaded
         self._manga_ocr = None
         self._paddle_ocr = None
         self._active_engine = None
+        self._cache_size = cache_size
+        self._result_cache: OrderedDict[Tuple[OCREngine, bytes], str] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     @property
     def current_engine(self) -> OCREngine:
         """Get the currently selected engine."""
         return self._current_engine
 
+    @property
+    def keep_engines_loaded(self) -> bool:
+        """Whether models stay loaded after switching engines."""
+        return self._keep_engines_loaded
+
+    @keep_engines_loaded.setter
+    def keep_engines_loaded(self, value: bool) -> None:
+        """Set whether models stay loaded after switching engines."""
+        self._keep_engines_loaded = value
+
     @property
     def is_loaded(self) -> bool:
         """Check if the current engine is loaded."""
@@ -87,23 +117,31 @@ class OCRManager:
         return engine.uses_gpu if engine else False
 
     def _get_engine_instance(self):
-        """Get the current engine instance."""
+        """Get the current engine instance (cached until the engine changes)."""
+        if self._active_engine is not None:
+            return self._active_engine
+
         if self._current_engine == OCREngine.MANGA_OCR:
             if self._manga_ocr is None:
                 from .ocr_engine import get_ocr_engine
                 self._manga_ocr = get_ocr_engine()
-            return self._manga_ocr
+            self._active_engine = self._manga_ocr
+            return self._active_engine
         elif self._current_engine == OCREngine.PADDLE_OCR:
             if self._paddle_ocr is None:
                 from .paddle_ocr_engine import get_paddle_ocr_engine
                 self._paddle_ocr = get_paddle_ocr_engine()
-            return self._paddle_ocr
+            self._active_engine = self._paddle_ocr
+            return self._active_engine
         return None
 
     def set_engine(self, engine: OCREngine) -> None:
         """
         Set the active OCR engine.
 
+        The previous engine is unloaded and its cached GPU memory released
+        so the new backend can use it, unless keep_engines_loaded is set.
+
         Note: This doesn't automatically load the new engine.
         Call load_model_async() after changing engines.
 
@@ -112,7 +150,10 @@ class OCRManager:
         """
         if engine != self._current_engine:
             log_info(f"Switching OCR engine from {self._current_engine.value} to {engine.value}")
+            if not self._keep_engines_loaded:
+                self.unload_current(release_gpu=True)
             self._current_engine = engine
+            self._active_engine = None
 
     def load_model_async(self, callback: Optional[Callable[[bool, Optional[str]], None]] = None) -> None:
         """
@@ -148,21 +189,143 @@ class OCRManager:
         if not engine.is_loaded:
             raise RuntimeError(f"{get_engine_name(self._current_engine)} model not loaded")
 
-        return engine.perform_ocr(image)
+        key = self._cache_key(image)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        result = engine.perform_ocr(image)
+        self._cache_put(key, result)
+        return result
+
+    def perform_ocr_async(self, image: Image.Image) -> Future:
+        """
+        Perform OCR using the current engine without blocking on inference.
+
+        Engines with a worker thread queue the image there (and may cancel
+        the future if newer requests supersede it); others run it on the
+        calling thread and return an already completed future.
 
-    def unload_current(self) -> None:
-        """Unload the current engine to free memory."""
+        Args:
+            image: PIL Image to process
+
+        Returns:
+            Future resolving to the extracted text
+
+        Raises:
+            RuntimeError: If engine not loaded
+        """
+        engine = self._get_engine_instance()
+        if engine is None:
+            raise RuntimeError("No OCR engine available")
+
+        if not engine.is_loaded:
+            raise RuntimeError(f"{get_engine_name(self._current_engine)} model not loaded")
+
+        key = self._cache_key(image)
+        cached = self._cache_get(key)
+        if cached is not None:
+            future: Future = Future()
+            future.set_result(cached)
+            return future
+
+        if hasattr(engine, "perform_ocr_async"):
+            future = engine.perform_ocr_async(image)
+        else:
+            future = Future()
+            try:
+                future.set_result(engine.perform_ocr(image))
+            except Exception as e:
+                future.set_exception(e)
+
+        if key is not None:
+            def remember(done: Future) -> None:
+                if not done.cancelled() and done.exception() is None:
+                    self._cache_put(key, done.result())
+            future.add_done_callback(remember)
+        return future
+
+    def _cache_key(self, image: Image.Image) -> Optional[Tuple[OCREngine, bytes]]:
+        """
+        Get the result-cache key for an image, or None if caching is off.
+
+        The key is a digest of the exact pixels (plus size and mode), so
+        only byte-identical captures hit; a downscaled perceptual hash
+        could return another region's text for captures that differ by a
+        single character.
+        """
+        if self._cache_size <= 0:
+            return None
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16)
+        digest.update(f"{image.mode}{image.size}".encode())
+        return (self._current_engine, digest.digest())
+
+    def _cache_get(self, key: Optional[Tuple[OCREngine, bytes]]) -> Optional[str]:
+        """Look up a cached result, marking it most recently used."""
+        if key is None:
+            return None
+        with self._cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+                log_debug("OCR result served from cache")
+            return result
+
+    def _cache_put(self, key: Optional[Tuple[OCREngine, bytes]], result: str) -> None:
+        """Store a result, evicting the least recently used entry when full."""
+        if key is None:
+            return
+        with self._cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self._cache_size:
+                self._result_cache.popitem(last=False)
+
+    def perform_ocr_batch(self, images: List[Image.Image]) -> List[str]:
+        """
+        Perform OCR on several images using the current engine.
+
+        Uses the engine's batched path when it has one, otherwise
+        processes the images one at a time.
+
+        Args:
+            images: PIL Images to process
+
+        Returns:
+            Extracted text for each image, in input order
+
+        Raises:
+            RuntimeError: If engine not loaded or OCR fails
+        """
+        engine = self._get_engine_instance()
+        if engine is None:
+            raise RuntimeError("No OCR engine available")
+
+        if not engine.is_loaded:
+            raise RuntimeError(f"{get_engine_name(self._current_engine)} model not loaded")
+
+        if hasattr(engine, "perform_ocr_batch"):
+            return engine.perform_ocr_batch(images)
+        return [engine.perform_ocr(image) for image in images]
+
+    def unload_current(self, release_gpu: bool = False) -> None:
+        """
+        Unload the current engine to free memory.
+
+        Args:
+            release_gpu: Also release the engine's cached GPU memory
+        """
         engine = self._get_engine_instance()
         if engine and engine.is_loaded:
             log_info(f"Unloading {get_engine_name(self._current_engine)} model...")
-            engine.unload_model()
+            engine.unload_model(release_gpu=release_gpu)
 
     def unload_all(self) -> None:
-        """Unload all engines to free memory."""
+        """Unload all engines and release their GPU memory."""
         if self._manga_ocr and self._manga_ocr.is_loaded:
-            self._manga_ocr.unload_model()
+            self._manga_ocr.unload_model(release_gpu=True)
         if self._paddle_ocr and self._paddle_ocr.is_loaded:
-            self._paddle_ocr.unload_model()
+            self._paddle_ocr.unload_model(release_gpu=True)
 
 
 # Global manager instance
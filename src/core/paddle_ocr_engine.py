@@ -9,12 +9,19 @@ See: https://pypi.org/project/paddleocr/
 """
 
 from __future__ import annotations
+import contextlib
+import importlib.util
+import logging
+import os
 import threading
-from typing import Optional, List, Tuple, Callable
+from typing import Optional, List, Tuple, Callable, Literal
 from PIL import Image
 import numpy as np
 
-from ..utils.logger import log_info, log_error, log_debug, log_warning
+from ..utils.logger import get_logger, log_info, log_error, log_debug, log_warning
+
+# Minimum recognition confidence for a text line to be kept
+MIN_CONFIDENCE = 0.3
 
 
 class PaddleOCRWrapper:
@@ -22,26 +29,34 @@ class PaddleOCRWrapper:
     Wrapper for PaddleOCR with Japanese language support.
 
     Uses PaddleOCR 3.x API with Japanese recognition model.
-    Supports both GPU and CPU inference.
+    Supports both GPU and CPU inference. Use get_paddle_ocr_engine()
+    to obtain the shared instance.
     """
 
-    _instance: Optional[PaddleOCRWrapper] = None
-    _lock = threading.Lock()
-    _initialized = False
-
-    def __new__(cls) -> PaddleOCRWrapper:
-        """Thread-safe singleton pattern."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self) -> None:
-        """Initialize the PaddleOCR wrapper (only runs once due to singleton)."""
-        if PaddleOCRWrapper._initialized:
-            return
+    # PaddleOCR class, imported on first load and reused for reloads
+    _PaddleOCRCls = None
 
+    def __init__(
+        self,
+        low_memory: bool = True,
+        backend: Literal["paddle", "onnx"] = "onnx",
+        warmup: bool = True,
+    ) -> None:
+        """
+        Initialize the PaddleOCR wrapper.
+
+        Args:
+            low_memory: Use batch size 1 for recognition, which keeps
+                Paddle's memory arenas small. Captures are recognized one
+                at a time anyway, so larger batches don't help throughput.
+            backend: Inference backend for the CPU path. "onnx" enables
+                PaddleOCR's high-performance inference, which runs the
+                models on ONNX Runtime or OpenVINO when installed
+                (paddleocr install_hpi_deps cpu); "paddle" always uses
+                Paddle's native engine. GPU inference is unaffected.
+            warmup: Run a dummy prediction while loading so the first real
+                capture doesn't pay for predictor initialization
+        """
         self._ocr = None
         self._is_loaded = False
         self._is_loading = False
@@ -49,8 +64,10 @@ class PaddleOCRWrapper:
         self._load_lock = threading.Lock()
         self._load_event = threading.Event()
         self._use_gpu = False
-
-        PaddleOCRWrapper._initialized = True
+        self._low_memory = low_memory
+        self._backend = backend
+        self._warmup = warmup
+        self._paddle = None  # paddle module, cached on load
 
     @property
     def is_loaded(self) -> bool:
@@ -110,6 +127,7 @@ class PaddleOCRWrapper:
                 # Check for GPU availability
                 try:
                     import paddle
+                    self._paddle = paddle
                     log_debug("Checking PaddlePaddle GPU support...")
                     if paddle.device.is_compiled_with_cuda():
                         # Check if GPU is actually available
@@ -125,8 +143,13 @@ class PaddleOCRWrapper:
                     log_debug(f"GPU check failed: {e}, defaulting to CPU")
 
                 # Import and initialize PaddleOCR
-                log_debug("Importing PaddleOCR module...")
-                from paddleocr import PaddleOCR
+                if PaddleOCRWrapper._PaddleOCRCls is None:
+                    if importlib.util.find_spec("paddleocr") is None:
+                        raise ImportError("No module named 'paddleocr'")
+                    log_debug("Importing PaddleOCR module...")
+                    from paddleocr import PaddleOCR
+                    PaddleOCRWrapper._PaddleOCRCls = PaddleOCR
+                PaddleOCR = PaddleOCRWrapper._PaddleOCRCls
 
                 # Configure for Japanese OCR
                 # PaddleOCR 3.x API - uses predict() method
@@ -134,12 +157,43 @@ class PaddleOCRWrapper:
 
                 # PaddleOCR 3.x initialization parameters
                 # See: https://www.paddleocr.ai/latest/en/version3.x/pipeline_usage/OCR.html
-                self._ocr = PaddleOCR(
-                    lang='japan',  # Japanese recognition model
-                    use_doc_orientation_classify=False,  # Disable document orientation (not needed for screen capture)
-                    use_doc_unwarping=False,  # Disable document unwarping
-                    use_textline_orientation=True,  # Enable for vertical text support
-                )
+                options = {}
+                if self._low_memory:
+                    # 3.x names for rec_batch_num / cls_batch_num
+                    options["text_recognition_batch_size"] = 1
+                    options["textline_orientation_batch_size"] = 1
+                if not self._use_gpu:
+                    options["enable_mkldnn"] = True
+                    options["cpu_threads"] = os.cpu_count() or 1
+
+                def create(**extra):
+                    return PaddleOCR(
+                        lang='japan',  # Japanese recognition model
+                        use_doc_orientation_classify=False,  # Disable document orientation (not needed for screen capture)
+                        use_doc_unwarping=False,  # Disable document unwarping
+                        use_textline_orientation=True,  # Enable for vertical text support
+                        **options,
+                        **extra,
+                    )
+
+                self._ocr = None
+                if not self._use_gpu and self._backend == "onnx":
+                    # High-performance inference picks ONNX Runtime / OpenVINO on CPU
+                    try:
+                        self._ocr = create(enable_hpi=True)
+                        log_info("PaddleOCR using high-performance CPU backend")
+                    except Exception as e:
+                        log_warning(f"High-performance backend unavailable, using Paddle: {e}")
+                if self._ocr is None:
+                    self._ocr = create()
+
+                if self._warmup:
+                    try:
+                        with self._no_grad():
+                            self._ocr.predict(np.full((64, 256, 3), 255, dtype=np.uint8))
+                        log_debug("PaddleOCR warmup complete")
+                    except Exception as e:
+                        log_warning(f"PaddleOCR warmup failed: {e}")
 
                 self._is_loaded = True
                 log_info("PaddleOCR Japanese model loaded successfully!")
@@ -178,6 +232,9 @@ class PaddleOCRWrapper:
         Returns:
             True if model loaded successfully, False otherwise
         """
+        # Fast path: is_set() doesn't take the event's condition lock
+        if self._load_event.is_set():
+            return self._is_loaded
         self._load_event.wait(timeout)
         return self._is_loaded
 
@@ -203,17 +260,23 @@ class PaddleOCRWrapper:
             raise RuntimeError("OCR model is None despite being marked as loaded")
 
         try:
-            # Convert PIL Image to numpy array (PaddleOCR expects numpy/path)
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-
-            img_array = np.array(image)
+            # Convert PIL Image to numpy array (PaddleOCR expects numpy/path).
+            # asarray avoids a second copy; the array is read-only, which is
+            # fine since PaddleOCR never writes to its input.
+            if image.mode == 'RGB':
+                img_array = np.asarray(image)
+            elif image.mode == 'RGBA':
+                # Drop alpha directly instead of a PIL conversion pass
+                img_array = np.ascontiguousarray(np.asarray(image)[..., :3])
+            else:
+                img_array = np.asarray(image.convert('RGB'))
 
             log_debug(f"Running PaddleOCR on image shape: {img_array.shape}")
 
             # PaddleOCR 3.x uses predict() method instead of ocr()
             # Returns a list of Result objects
-            results = self._ocr.predict(img_array)
+            with self._no_grad():
+                results = self._ocr.predict(img_array)
 
             log_debug(f"PaddleOCR result count: {len(results) if results else 0}")
 
@@ -223,49 +286,30 @@ class PaddleOCRWrapper:
 
             # Extract text from PaddleOCR 3.x Result objects
             # Each Result has: rec_texts (list of strings), rec_scores (list of floats)
+            debug = get_logger().isEnabledFor(logging.DEBUG)
             texts = []
-            for idx, res in enumerate(results):
-                log_debug(f"Processing result {idx}: {type(res)}")
-
-                # Try to access rec_texts attribute (PaddleOCR 3.x structure)
-                if hasattr(res, 'rec_texts') and res.rec_texts:
-                    rec_texts = res.rec_texts
-                    rec_scores = getattr(res, 'rec_scores', [1.0] * len(rec_texts))
-
-                    for text, score in zip(rec_texts, rec_scores):
-                        log_debug(f"Found text: '{text}' with confidence: {score:.2f}")
-                        if text and score > 0.3:
-                            texts.append(text)
-                            log_debug(f"Accepted: '{text}' (conf: {score:.2f})")
-
-                # Fallback: try dictionary-style access
-                elif isinstance(res, dict):
-                    if 'rec_texts' in res:
-                        rec_texts = res['rec_texts']
-                        rec_scores = res.get('rec_scores', [1.0] * len(rec_texts))
-                        for text, score in zip(rec_texts, rec_scores):
-                            if text and score > 0.3:
-                                texts.append(text)
-                                log_debug(f"Accepted (dict): '{text}' (conf: {score:.2f})")
+            for res in results:
+                # Result objects expose attributes; plain dicts need key access
+                rec_texts = getattr(res, 'rec_texts', None)
+                rec_scores = getattr(res, 'rec_scores', None)
+                if rec_texts is None and isinstance(res, dict):
+                    rec_texts = res.get('rec_texts')
+                    rec_scores = res.get('rec_scores')
+
+                if rec_texts is not None:
+                    if len(rec_texts):
+                        texts.extend(self._filter_recognitions(rec_texts, rec_scores))
 
                 # Legacy fallback for older API structure [[box, (text, conf)], ...]
                 elif isinstance(res, list):
-                    log_debug(f"Trying legacy result parsing for list: {res}")
-                    for detection in res:
-                        if detection is None or not isinstance(detection, (list, tuple)):
-                            continue
-                        if len(detection) >= 2:
-                            text_info = detection[1]
-                            if isinstance(text_info, (list, tuple)) and len(text_info) >= 1:
-                                text = text_info[0]
-                                confidence = text_info[1] if len(text_info) > 1 else 1.0
-                                if text and confidence > 0.3:
-                                    texts.append(str(text))
-                                    log_debug(f"Accepted (legacy): '{text}' (conf: {confidence:.2f})")
+                    texts.extend(self._parse_legacy_result(res))
 
-                else:
+                elif debug:
                     log_debug(f"Unknown result type: {type(res)}, value: {res}")
 
+            if debug:
+                log_debug(f"Accepted {len(texts)} text line(s): {texts}")
+
             # Join all detected text
             full_text = ''.join(texts)
             log_debug(f"Final extracted text: '{full_text}'")
@@ -275,8 +319,48 @@ class PaddleOCRWrapper:
             log_error(f"PaddleOCR inference error: {e}")
             raise RuntimeError(f"OCR inference failed: {e}")
 
-    def unload_model(self) -> None:
-        """Unload the model to free memory."""
+    @staticmethod
+    def _filter_recognitions(rec_texts: List[str], rec_scores: Optional[List[float]]) -> List[str]:
+        """Keep non-empty recognized lines above the confidence threshold, in one vectorized pass."""
+        texts = np.asarray(rec_texts, dtype=object)
+        if rec_scores is None:
+            mask = np.ones(len(texts), dtype=bool)
+        else:
+            mask = np.asarray(rec_scores, dtype=np.float64) > MIN_CONFIDENCE
+        mask &= texts.astype(bool)
+        return texts[mask].tolist()
+
+    @staticmethod
+    def _parse_legacy_result(res: list) -> List[str]:
+        """Extract accepted text from the 2.x [[box, (text, conf)], ...] structure."""
+        texts = []
+        for detection in res:
+            if detection is None or not isinstance(detection, (list, tuple)):
+                continue
+            if len(detection) >= 2:
+                text_info = detection[1]
+                if isinstance(text_info, (list, tuple)) and len(text_info) >= 1:
+                    text = text_info[0]
+                    confidence = text_info[1] if len(text_info) > 1 else 1.0
+                    if text and confidence > MIN_CONFIDENCE:
+                        texts.append(str(text))
+        return texts
+
+    def _no_grad(self) -> contextlib.AbstractContextManager:
+        """Get a context that disables gradient tracking during inference."""
+        if self._paddle is None:
+            return contextlib.nullcontext()
+        return self._paddle.no_grad()
+
+    def unload_model(self, release_gpu: bool = False) -> None:
+        """
+        Unload the model to free memory.
+
+        Args:
+            release_gpu: Also release Paddle's cached GPU memory, e.g. when
+                switching engines. Skipped for a plain reload since it
+                synchronizes the device.
+        """
         with self._load_lock:
             if self._ocr is not None:
                 del self._ocr
@@ -287,17 +371,27 @@ class PaddleOCRWrapper:
             self._load_error = None
             self._load_event.clear()
 
-            # Try to free GPU memory
+        # Free cached GPU memory outside the lock; empty_cache() waits for the device
+        if release_gpu and self._use_gpu and self._paddle is not None:
             try:
-                import paddle
-                paddle.device.cuda.empty_cache()
+                self._paddle.device.cuda.empty_cache()
             except Exception:
                 pass
 
-            log_info("PaddleOCR model unloaded")
+        log_info("PaddleOCR model unloaded")
+
+
+_paddle_ocr_engine: Optional[PaddleOCRWrapper] = None
+_paddle_ocr_engine_lock = threading.Lock()
 
 
-# Convenience function to get the singleton instance
+# Convenience function to get the shared instance (construction is locked,
+# lookups after the first are lock-free)
 def get_paddle_ocr_engine() -> PaddleOCRWrapper:
-    """Get the singleton PaddleOCR engine instance."""
-    return PaddleOCRWrapper()
+    """Get the shared PaddleOCR engine instance."""
+    global _paddle_ocr_engine
+    if _paddle_ocr_engine is None:
+        with _paddle_ocr_engine_lock:
+            if _paddle_ocr_engine is None:
+                _paddle_ocr_engine = PaddleOCRWrapper()
+    return _paddle_ocr_engine
@@ -6,19 +6,22 @@ settings, and controlling the overlay.
 """
 
 from __future__ import annotations
+import glob
 import json
+import logging
 import os
 import threading
-from typing import Optional
-from PIL import Image
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, FrozenSet, Optional, Tuple, TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QTextEdit, QStatusBar,
     QSystemTrayIcon, QMenu, QGroupBox, QComboBox,
     QMessageBox, QToolTip, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QMetaObject, Q_ARG, Qt as QtCore
-from PyQt6.QtGui import QIcon, QAction, QPixmap, QCursor, QFont, QColor
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, pyqtSignal, QMetaObject, Q_ARG, Qt as QtCore
+from PyQt6.QtGui import QIcon, QAction, QPixmap, QCursor, QFont, QColor, QImage
 
 from .overlay import CaptureWindow
 from ..core.ocr_manager import get_ocr_manager, OCREngine, get_engine_name, get_engine_description
@@ -27,6 +30,159 @@ from ..utils.image_ops import PreprocessingMode, preprocess_image, mode_descript
 from ..utils.clipboard import copy_text
 from ..utils.logger import get_logger, log_info, log_error, log_warning, log_debug, log_exception
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Optional faster JSON parser/encoder for the settings file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Edge length of the generated tray/window icon
+ICON_SIZE = 64
+
+# Dark theme for the main window, shared by every instance
+_MAIN_STYLESHEET = """
+    QMainWindow {
+        background-color: #1a1a1a;
+    }
+    QWidget {
+        background-color: #1a1a1a;
+        color: #e0e0e0;
+    }
+    QPushButton {
+        background-color: #4a4a4a;
+        color: #e0e0e0;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #5a5a5a;
+    }
+    QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+    QPushButton:disabled {
+        background-color: #2a2a2a;
+        color: #666666;
+    }
+    QPushButton#primary {
+        background-color: #ff6b6b;
+        color: #1a1a1a;
+    }
+    QPushButton#primary:hover {
+        background-color: #ff5252;
+    }
+    QTextEdit {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 10px;
+        font-family: 'Yu Gothic UI', 'Meiryo', sans-serif;
+        font-size: 14px;
+    }
+    QGroupBox {
+        border: 2px solid #ff6b6b;
+        border-radius: 4px;
+        margin-top: 10px;
+        padding-top: 10px;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px;
+        color: #ff6b6b;
+    }
+    QComboBox {
+        background-color: #2d2d2d;
+        border: 1px solid #3d3d3d;
+        border-radius: 4px;
+        padding: 5px 10px;
+    }
+    QComboBox::drop-down {
+        border: none;
+    }
+    QStatusBar {
+        background-color: #2d2d2d;
+        color: #a0a0a0;
+    }
+"""
+
+# Direct key-state query for mouse hotkey modifiers (Windows only)
+try:
+    import ctypes
+    _GetAsyncKeyState = ctypes.windll.user32.GetAsyncKeyState
+except (ImportError, AttributeError, OSError):
+    _GetAsyncKeyState = None
+
+# Virtual-key codes for each hotkey modifier (either code counts as held)
+_MODIFIER_VKS = {
+    "ctrl": (0x11,),        # VK_CONTROL
+    "alt": (0x12,),         # VK_MENU
+    "shift": (0x10,),       # VK_SHIFT
+    "win": (0x5B, 0x5C),    # VK_LWIN, VK_RWIN
+}
+
+# Result appends within this many ms are written to the results area together
+RESULTS_FLUSH_INTERVAL_MS = 16
+
+# Oldest lines are dropped from the results area beyond this many
+RESULTS_MAX_BLOCKS = 5000
+
+# Where the recolored icon is cached between launches
+ICON_CACHE_DIR = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'daisho')
+
+
+def _windows_process_names() -> set[str]:
+    """Get the lowercased executable names of all running processes (Windows only)."""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESSENTRY32W(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ProcessID", wintypes.DWORD),
+            ("th32DefaultHeapID", ctypes.c_size_t),
+            ("th32ModuleID", wintypes.DWORD),
+            ("cntThreads", wintypes.DWORD),
+            ("th32ParentProcessID", wintypes.DWORD),
+            ("pcPriClassBase", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+            ("szExeFile", wintypes.WCHAR * 260),
+        ]
+
+    TH32CS_SNAPPROCESS = 0x00000002
+    INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    kernel32.Process32FirstW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.Process32NextW.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot == INVALID_HANDLE_VALUE:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    names = set()
+    try:
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            names.add(entry.szExeFile.lower())
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    return names
+
 
 class MainWindow(QMainWindow):
     """
@@ -39,7 +195,10 @@ class MainWindow(QMainWindow):
     # Signals for thread-safe GUI updates
     ocrCompleted = pyqtSignal(str)
     ocrError = pyqtSignal(str)
+    ocrSuperseded = pyqtSignal()  # A queued OCR request was dropped for a newer capture
     triggerCapture = pyqtSignal()  # Signal to trigger capture from hotkey thread
+    iconDataReady = pyqtSignal(bytes)  # Recolored RGBA icon pixels from the icon loader thread
+    modelLoaded = pyqtSignal(bool, str)  # (success, error message) from the model loader thread
 
     def __init__(self) -> None:
         super().__init__()
@@ -48,9 +207,33 @@ class MainWindow(QMainWindow):
         # State
         self._settings = self._get_default_settings()
         self._overlay: Optional[CaptureWindow] = None
+        self._overlay_visible = False  # Tracked via the overlay's visibilityChanged signal
+        self._capture_region_fn: Optional[Callable[[], None]] = None  # Bound overlay.capture_region
         self._tray_icon: Optional[QSystemTrayIcon] = None
         self._hotkey_registered = False
         self._statusbar: Optional[QStatusBar] = None  # Initialize early to avoid AttributeError
+        self._status_label: Optional[QLabel] = None  # Created in _setup_ui, after model loading starts
+        self._pending_model_status: Optional[tuple] = None  # Load result that arrived before the UI
+        self._saved_settings_data: Optional[bytes] = None  # Settings file contents as last read/written
+        self._settings_write_lock = threading.Lock()  # Serializes background settings writes
+        self._pending_settings_data: Optional[bytes] = None  # Newest settings bytes not yet written
+        self._preprocess_mode = PreprocessingMode.NONE  # Resolved "preprocessing_mode" setting
+        self._parsed_hotkey = self._parse_hotkey("ctrl+shift")  # Parsed "capture_hotkey" setting
+
+        # Captures are preprocessed on one persistent pool thread, keeping
+        # only the newest capture if several arrive while it is busy
+        self._ocr_pool = QThreadPool(self)
+        self._ocr_pool.setMaxThreadCount(1)
+        self._ocr_pool.setExpiryTimeout(-1)
+        self._capture_lock = threading.Lock()
+        self._latest_capture: Optional[Image.Image] = None
+        self._capture_job_pending = False
+
+        # Overlay geometry is persisted once a drag/resize has settled
+        self._geom_save_timer = QTimer(self)
+        self._geom_save_timer.setSingleShot(True)
+        self._geom_save_timer.setInterval(250)
+        self._geom_save_timer.timeout.connect(self._persist_geometry)
 
         # Components
         self._ocr_manager = get_ocr_manager()
@@ -60,11 +243,25 @@ class MainWindow(QMainWindow):
         self._load_settings()
         log_debug("Settings loaded")
 
-        # Set up UI
+        # Start loading the OCR model now that the engine is known, so the
+        # weights are read from disk while the widgets are being built
+        self.modelLoaded.connect(self._update_model_status, Qt.ConnectionType.QueuedConnection)
+        self._start_ocr_loading()
+
+        # Set up UI; only what the first paint needs happens here
         self._setup_window()
         log_debug("Window configured")
         self._setup_ui()
         log_debug("UI setup complete")
+
+        # Everything else runs on the first event loop tick, after the
+        # window (if shown by the caller) has had a chance to paint
+        QTimer.singleShot(0, self._deferred_startup)
+
+        log_info("MainWindow initialization complete")
+
+    def _deferred_startup(self) -> None:
+        """Finish startup once the event loop is running."""
         self._setup_tray()
         log_debug("Tray setup complete")
         self._connect_signals()
@@ -72,21 +269,20 @@ class MainWindow(QMainWindow):
 
         # Set up hotkey after signals are connected
         self._setup_hotkey()
+        self._macro_manager.set_kill_key(self._settings.get("kill_key", "f12"))
         log_debug("Hotkey setup complete")
 
-        # Start loading OCR model
-        self._start_ocr_loading()
-
         # Auto-launch japReader if enabled
         self._auto_launch_japreader()
 
-        log_info("MainWindow initialization complete")
+        log_info("Deferred startup complete")
 
     def _get_default_settings(self) -> dict:
         """Get default settings."""
         return {
             "capture_hotkey": "ctrl+shift",
             "ocr_engine": OCREngine.MANGA_OCR.value,
+            "keep_engines_loaded": False,
             "preprocessing_mode": "none",
             "auto_copy": True,
             "show_notification": True,
@@ -104,16 +300,19 @@ class MainWindow(QMainWindow):
         settings_file = "ocr_settings.json"
         if os.path.exists(settings_file):
             try:
-                with open(settings_file, "r") as f:
-                    loaded = json.load(f)
-                    self._settings.update(loaded)
-                    log_info(f"Settings loaded from {settings_file}: hotkey={self._settings.get('capture_hotkey')}")
+                with open(settings_file, "rb") as f:
+                    data = f.read()
+                loaded = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                self._settings.update(loaded)
+                self._saved_settings_data = data
+                log_info(f"Settings loaded from {settings_file}: hotkey={self._settings.get('capture_hotkey')}")
             except Exception as e:
                 log_error(f"Failed to load settings: {e}")
         else:
             log_info(f"No settings file found at {settings_file}, using defaults")
 
         # Set the OCR engine from settings
+        self._ocr_manager.keep_engines_loaded = bool(self._settings.get("keep_engines_loaded", False))
         engine_value = self._settings.get("ocr_engine", OCREngine.MANGA_OCR.value)
         try:
             engine = OCREngine(engine_value)
@@ -123,6 +322,17 @@ class MainWindow(QMainWindow):
             log_warning(f"Unknown OCR engine: {engine_value}, using default manga-ocr")
             self._ocr_manager.set_engine(OCREngine.MANGA_OCR)
 
+        # Resolve the preprocessing mode once; captures just read the enum
+        mode_value = self._settings.get("preprocessing_mode", "none")
+        try:
+            self._preprocess_mode = PreprocessingMode(mode_value)
+        except ValueError:
+            log_warning(f"Unknown preprocessing mode: {mode_value}, using none")
+            self._preprocess_mode = PreprocessingMode.NONE
+
+        # Parse the capture hotkey once; registration reuses the result
+        self._parsed_hotkey = self._parse_hotkey(self._settings.get("capture_hotkey", "ctrl+shift"))
+
     def _setup_window(self) -> None:
         """Configure the main window."""
         self.setWindowTitle("代書 - Japanese OCR")
@@ -130,74 +340,7 @@ class MainWindow(QMainWindow):
         self.resize(700, 600)
 
         # Dark theme stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a1a;
-            }
-            QWidget {
-                background-color: #1a1a1a;
-                color: #e0e0e0;
-            }
-            QPushButton {
-                background-color: #4a4a4a;
-                color: #e0e0e0;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5a5a5a;
-            }
-            QPushButton:pressed {
-                background-color: #3a3a3a;
-            }
-            QPushButton:disabled {
-                background-color: #2a2a2a;
-                color: #666666;
-            }
-            QPushButton#primary {
-                background-color: #ff6b6b;
-                color: #1a1a1a;
-            }
-            QPushButton#primary:hover {
-                background-color: #ff5252;
-            }
-            QTextEdit {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 10px;
-                font-family: 'Yu Gothic UI', 'Meiryo', sans-serif;
-                font-size: 14px;
-            }
-            QGroupBox {
-                border: 2px solid #ff6b6b;
-                border-radius: 4px;
-                margin-top: 10px;
-                padding-top: 10px;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px;
-                color: #ff6b6b;
-            }
-            QComboBox {
-                background-color: #2d2d2d;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 5px 10px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QStatusBar {
-                background-color: #2d2d2d;
-                color: #a0a0a0;
-            }
-        """)
+        self.setStyleSheet(_MAIN_STYLESHEET)
 
     def _setup_ui(self) -> None:
         """Set up the user interface."""
@@ -220,7 +363,8 @@ class MainWindow(QMainWindow):
         status_group = QGroupBox("Status")
         status_layout = QVBoxLayout(status_group)
 
-        self._status_label = QLabel("Loading OCR model...")
+        engine_name = get_engine_name(self._ocr_manager.current_engine)
+        self._status_label = QLabel(f"Loading {engine_name}...")
         self._status_label.setStyleSheet("font-size: 14px;")
         status_layout.addWidget(self._status_label)
 
@@ -228,6 +372,11 @@ class MainWindow(QMainWindow):
         self._gpu_label.setStyleSheet("color: #808080; font-size: 11px;")
         status_layout.addWidget(self._gpu_label)
 
+        # Model loading starts before the UI exists and may already be done
+        if self._pending_model_status is not None:
+            self._update_model_status(*self._pending_model_status)
+            self._pending_model_status = None
+
         # Show current hotkey
         hotkey = self._settings.get("capture_hotkey", "ctrl+shift")
         self._hotkey_label = QLabel(f"Capture hotkey: {hotkey}")
@@ -294,8 +443,17 @@ class MainWindow(QMainWindow):
             "2. Position and resize the overlay over Japanese text\n"
             f"3. Press the capture hotkey ({hotkey})"
         )
+        self._results_text.document().setMaximumBlockCount(RESULTS_MAX_BLOCKS)
         results_layout.addWidget(self._results_text)
 
+        # Appends are buffered and written in one go per flush, so bursts of
+        # results cost one document layout instead of one each
+        self._pending_results: deque[str] = deque()
+        self._results_flush_timer = QTimer(self)
+        self._results_flush_timer.setSingleShot(True)
+        self._results_flush_timer.setInterval(RESULTS_FLUSH_INTERVAL_MS)
+        self._results_flush_timer.timeout.connect(self._flush_results)
+
         # Result buttons
         result_buttons = QHBoxLayout()
 
@@ -317,20 +475,39 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self._statusbar)
         self._statusbar.showMessage("Ready")
 
-    def _load_and_recolor_icon(self) -> QIcon:
-        """Load icon from file and shift color to purple."""
-        import os
-        from PyQt6.QtGui import QPainter, QBrush, QImage
-
-        # Try to load the icon from the specified path
+    @staticmethod
+    def _icon_source_path() -> str:
+        """Get the path of the Firefox taskbar icon the tray icon is made from."""
         appdata = os.environ.get('APPDATA', '')
-        icon_path = os.path.join(
+        return os.path.join(
             appdata,
             'Mozilla', 'Firefox', 'Profiles',
             'wwhjpx9k.default-release', 'taskbartabs', 'icons',
             'c6f48e66-845c-4ef6-967c-6130bdc54f4a.ico'
         )
 
+    @staticmethod
+    def _icon_cache_path(icon_path: str) -> Optional[str]:
+        """Get the cached recolored icon path for the current source file, or None if it is missing."""
+        try:
+            key = int(os.path.getmtime(icon_path))
+        except OSError:
+            return None
+        return os.path.join(ICON_CACHE_DIR, f"tray_{key}.png")
+
+    def _load_recolored_icon_data(self) -> Optional[bytes]:
+        """
+        Load icon from file and shift color to purple.
+
+        Only uses PIL/NumPy, so it is safe to run off the GUI thread. The
+        result is also saved as a PNG so later launches can skip this.
+
+        Returns:
+            ICON_SIZE x ICON_SIZE RGBA pixels, or None if the icon is unavailable
+        """
+        # Try to load the icon from the specified path
+        icon_path = self._icon_source_path()
+
         if os.path.exists(icon_path):
             try:
                 # Load with PIL to manipulate colors
@@ -343,44 +520,79 @@ class MainWindow(QMainWindow):
                     # ICO files can have multiple sizes
                     pil_img.seek(0)
                 pil_img = pil_img.convert('RGBA')
-                pil_img = pil_img.resize((64, 64), PILImage.Resampling.LANCZOS)
+                pil_img = pil_img.resize((ICON_SIZE, ICON_SIZE), PILImage.Resampling.LANCZOS)
 
                 # Convert to numpy for color manipulation
                 img_array = np.array(pil_img)
 
-                # Shift colors to purple (swap red and blue, boost both)
-                # Original RGB -> Purple shift: increase R and B, reduce G
-                r = img_array[:, :, 0].astype(float)
-                g = img_array[:, :, 1].astype(float)
-                b = img_array[:, :, 2].astype(float)
-                a = img_array[:, :, 3]
-
+                # Shift colors to purple (mix red and blue, boost both)
                 # Purple shift: R stays, G reduces, B increases
-                # Create a purple tint effect
-                new_r = np.clip(r * 0.8 + b * 0.4, 0, 255).astype(np.uint8)
-                new_g = np.clip(g * 0.3, 0, 255).astype(np.uint8)
-                new_b = np.clip(b * 0.6 + r * 0.6, 0, 255).astype(np.uint8)
-
-                img_array[:, :, 0] = new_r
-                img_array[:, :, 1] = new_g
-                img_array[:, :, 2] = new_b
-
-                # Convert back to PIL then to QPixmap
-                purple_img = PILImage.fromarray(img_array, 'RGBA')
-                data = purple_img.tobytes('raw', 'RGBA')
-
-                qimage = QImage(data, 64, 64, QImage.Format.Format_RGBA8888)
-                pixmap = QPixmap.fromImage(qimage)
+                #   new_r = 0.8 r + 0.4 b,  new_g = 0.3 g,  new_b = 0.6 r + 0.6 b
+                tint = np.array([
+                    [0.8, 0.0, 0.4],
+                    [0.0, 0.3, 0.0],
+                    [0.6, 0.0, 0.6],
+                ], dtype=np.float32)
+
+                # One float32 pass for all three channels; alpha is untouched
+                rgb = img_array[:, :, :3]
+                mixed = rgb.astype(np.float32) @ tint.T
+                np.clip(mixed, 0, 255, out=mixed)
+                rgb[...] = mixed  # Truncating cast back to uint8, in place
+
+                # The array is tightly packed RGBA, so its bytes feed QImage
+                # directly without a round trip through PIL
+                data = img_array.tobytes()
 
                 log_info(f"Loaded and recolored icon from: {icon_path}")
-                return QIcon(pixmap)
+                self._save_icon_cache(data, self._icon_cache_path(icon_path))
+                return data
 
             except Exception as e:
                 log_warning(f"Failed to load/recolor icon: {e}")
 
-        # Fallback: create a simple purple circle icon
         log_info("Using fallback purple icon")
-        pixmap = QPixmap(64, 64)
+        return None
+
+    @staticmethod
+    def _icon_qimage(data: bytes) -> QImage:
+        """Wrap recolored RGBA icon pixels in a QImage (safe off the GUI thread)."""
+        return QImage(data, ICON_SIZE, ICON_SIZE, 4 * ICON_SIZE, QImage.Format.Format_RGBA8888)
+
+    @staticmethod
+    def _save_icon_cache(data: bytes, cache_path: Optional[str]) -> None:
+        """Save the recolored icon and remove ones made from older source files."""
+        if cache_path is None:
+            return
+        try:
+            os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+            if not MainWindow._icon_qimage(data).save(cache_path, "PNG"):
+                raise OSError(f"could not write {cache_path}")
+            for stale in glob.glob(os.path.join(ICON_CACHE_DIR, "tray_*.png")):
+                if os.path.normcase(stale) != os.path.normcase(cache_path):
+                    os.remove(stale)
+            log_debug(f"Cached recolored icon at: {cache_path}")
+        except OSError as e:
+            log_debug(f"Could not cache recolored icon: {e}")
+
+    def _load_icon_in_background(self) -> None:
+        """Recolor the icon on a pool thread and hand the pixels to the GUI thread."""
+        data = self._load_recolored_icon_data()
+        if data is not None:
+            self.iconDataReady.emit(data)
+
+    def _on_icon_data_ready(self, data: bytes) -> None:
+        """Swap in the recolored icon (runs in main thread; QPixmap is GUI-thread only)."""
+        icon = QIcon(QPixmap.fromImage(self._icon_qimage(data)))
+        self.setWindowIcon(icon)
+        if self._tray_icon:
+            self._tray_icon.setIcon(icon)
+
+    def _fallback_icon(self) -> QIcon:
+        """Create a simple purple circle icon."""
+        from PyQt6.QtGui import QPainter, QBrush
+
+        pixmap = QPixmap(ICON_SIZE, ICON_SIZE)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
         painter.setBrush(QBrush(QColor(128, 0, 128)))  # Purple
@@ -396,8 +608,16 @@ class MainWindow(QMainWindow):
             print("System tray not available")
             return
 
-        # Load icon (purple-shifted from Firefox taskbar icon)
-        icon = self._load_and_recolor_icon()
+        # Use the purple-shifted Firefox taskbar icon cached by an earlier
+        # launch; otherwise start with the drawn icon while it is decoded
+        # and recolored on a pool thread, and swap it in when ready
+        cache_path = self._icon_cache_path(self._icon_source_path())
+        icon_cached = cache_path is not None and os.path.exists(cache_path)
+        if icon_cached:
+            icon = QIcon(cache_path)
+            log_debug(f"Using cached icon: {cache_path}")
+        else:
+            icon = self._fallback_icon()
 
         # Also set as window icon
         self.setWindowIcon(icon)
@@ -442,6 +662,10 @@ class MainWindow(QMainWindow):
 
         self._tray_icon.show()
 
+        if not icon_cached:
+            self.iconDataReady.connect(self._on_icon_data_ready, Qt.ConnectionType.QueuedConnection)
+            QThreadPool.globalInstance().start(self._load_icon_in_background)
+
     def _setup_engine_menu(self) -> None:
         """Set up the OCR engine submenu with available engines."""
         self._engine_menu.clear()
@@ -455,10 +679,16 @@ class MainWindow(QMainWindow):
             action.setCheckable(True)
             action.setChecked(engine == current_engine)
 
-            # Store reference and connect
+            # Store reference and connect; the engine rides on the action
             self._engine_actions[engine] = action
-            # Use lambda with default arg to capture engine value
-            action.triggered.connect(lambda checked, e=engine: self._on_engine_selected(e))
+            action.setData(engine)
+            action.triggered.connect(self._on_engine_action_triggered)
+
+    def _on_engine_action_triggered(self, checked: bool) -> None:
+        """Dispatch an engine menu action to _on_engine_selected."""
+        action = self.sender()
+        if action is not None:
+            self._on_engine_selected(action.data())
 
     def _on_engine_selected(self, engine: OCREngine) -> None:
         """Handle OCR engine selection from tray menu."""
@@ -492,20 +722,40 @@ class MainWindow(QMainWindow):
                 2000
             )
 
+    # Hotkey parts naming a mouse button, mapped to mouse library button names
+    _MOUSE_BUTTONS = {"mouse4": "x", "mouse5": "x2", "middle": "middle"}
+
+    @classmethod
+    def _parse_hotkey(cls, hotkey: str) -> Tuple[str, FrozenSet[str], Optional[str]]:
+        """
+        Parse a hotkey string such as "ctrl+mouse4".
+
+        Args:
+            hotkey: Hotkey string from settings
+
+        Returns:
+            Tuple of (kind, modifiers, button) where kind is "mouse" or "key"
+            and button is the mouse library button name (None for "key")
+        """
+        parts = hotkey.lower().split("+")
+        button = None
+        for part in parts:
+            if part in cls._MOUSE_BUTTONS:
+                button = cls._MOUSE_BUTTONS[part]
+        modifiers = frozenset(part for part in parts if part in _MODIFIER_VKS)
+        return ("mouse" if button is not None else "key", modifiers, button)
+
     def _setup_hotkey(self) -> None:
         """Set up global hotkey (keyboard or mouse button)."""
-        hotkey = self._settings.get("capture_hotkey", "ctrl+shift")
-
-        # Check if this is a mouse button hotkey
-        is_mouse = any(mb in hotkey.lower() for mb in ["mouse4", "mouse5", "middle"])
+        kind, modifiers, button = self._parsed_hotkey
 
         # Unregister previous hotkeys
         self._unregister_hotkeys()
 
-        if is_mouse:
-            self._setup_mouse_hotkey(hotkey)
+        if kind == "mouse":
+            self._setup_mouse_hotkey(modifiers, button)
         else:
-            self._setup_keyboard_hotkey(hotkey)
+            self._setup_keyboard_hotkey(self._settings.get("capture_hotkey", "ctrl+shift"))
 
     def _unregister_hotkeys(self) -> None:
         """Unregister all hotkeys (keyboard and mouse)."""
@@ -544,60 +794,32 @@ class MainWindow(QMainWindow):
             log_error(f"Could not set up keyboard hotkey: {e}")
             log_exception(e, "_setup_keyboard_hotkey")
 
-    def _setup_mouse_hotkey(self, hotkey: str) -> None:
-        """Set up a mouse button-based hotkey."""
+    def _setup_mouse_hotkey(self, modifiers: FrozenSet[str], mouse_button: str) -> None:
+        """Set up a mouse button-based hotkey from its parsed parts."""
         try:
             import mouse
 
-            # Parse the hotkey to get the mouse button
-            parts = hotkey.lower().split("+")
-            mouse_button = None
-            modifiers = []
-
-            for part in parts:
-                if part in ["mouse4", "mouse5", "middle"]:
-                    # Map to mouse library button names
-                    if part == "mouse4":
-                        mouse_button = "x"  # XButton1 (back)
-                    elif part == "mouse5":
-                        mouse_button = "x2"  # XButton2 (forward)
-                    elif part == "middle":
-                        mouse_button = "middle"
-                elif part in ["ctrl", "alt", "shift", "win"]:
-                    modifiers.append(part)
-
-            if mouse_button is None:
-                log_error(f"Could not parse mouse button from hotkey: {hotkey}")
-                return
-
             # Store modifiers for checking during callback
             self._mouse_hotkey_modifiers = modifiers
 
+            # The hook sees every mouse event in the system, so everything
+            # the callback needs is resolved up front into locals
+            ButtonEvent = mouse.ButtonEvent
+            DOWN = mouse.DOWN
+            emit = self.triggerCapture.emit
+            modifiers_held = self._make_modifier_check(modifiers)
+
             def mouse_callback(event):
                 """Handle mouse button events."""
-                if not isinstance(event, mouse.ButtonEvent):
-                    return
-                if event.event_type != 'down':
-                    return
-                if event.button != mouse_button:
-                    return
-
-                # Check keyboard modifiers if required
-                if self._mouse_hotkey_modifiers:
-                    try:
-                        import keyboard
-                        for mod in self._mouse_hotkey_modifiers:
-                            if not keyboard.is_pressed(mod):
-                                return
-                    except Exception:
-                        pass
-
-                log_debug(f"Mouse hotkey triggered: {hotkey}")
-                self.triggerCapture.emit()
+                if (event.__class__ is ButtonEvent
+                        and event.event_type == DOWN
+                        and event.button == mouse_button
+                        and (modifiers_held is None or modifiers_held())):
+                    emit()
 
             mouse.hook(mouse_callback)
             self._mouse_hotkey_registered = True
-            log_info(f"Global mouse hotkey registered: {hotkey}")
+            log_info(f"Global mouse hotkey registered: {'+'.join(sorted(modifiers) + [mouse_button])}")
 
         except ImportError:
             log_warning("mouse module not installed. Mouse hotkeys disabled.")
@@ -605,6 +827,41 @@ class MainWindow(QMainWindow):
             log_error(f"Could not set up mouse hotkey: {e}")
             log_exception(e, "_setup_mouse_hotkey")
 
+    @staticmethod
+    def _make_modifier_check(modifiers: FrozenSet[str]) -> Optional[Callable[[], bool]]:
+        """
+        Build a function reporting whether all hotkey modifiers are held.
+
+        On Windows this reads GetAsyncKeyState for precomputed virtual-key
+        codes; elsewhere it falls back to keyboard.is_pressed().
+
+        Returns:
+            The check, or None if there are no modifiers to check
+        """
+        if not modifiers:
+            return None
+
+        if _GetAsyncKeyState is not None:
+            vk_groups = tuple(_MODIFIER_VKS[mod] for mod in modifiers)
+
+            def held() -> bool:
+                return all(any(_GetAsyncKeyState(vk) & 0x8000 for vk in group) for group in vk_groups)
+            return held
+
+        try:
+            import keyboard
+        except ImportError:
+            return None  # Can't check modifiers; trigger on the button alone
+        is_pressed = keyboard.is_pressed
+        mods = tuple(modifiers)
+
+        def held() -> bool:
+            try:
+                return all(is_pressed(mod) for mod in mods)
+            except Exception:
+                return True
+        return held
+
     def _on_hotkey_pressed(self) -> None:
         """
         Called when hotkey is pressed (runs in keyboard thread).
@@ -616,22 +873,27 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self) -> None:
         """Connect internal signals."""
-        self.ocrCompleted.connect(self._on_ocr_complete)
-        self.ocrError.connect(self._on_ocr_error)
+        # All of these are emitted from worker/hook threads, so queue them
+        # explicitly instead of having Qt check thread affinity per emit
+        queued = Qt.ConnectionType.QueuedConnection
+        self.ocrCompleted.connect(self._on_ocr_complete, queued)
+        self.ocrError.connect(self._on_ocr_error, queued)
+        self.ocrSuperseded.connect(self._on_ocr_superseded, queued)
         # Connect capture trigger signal for thread-safe hotkey handling
-        self.triggerCapture.connect(self._do_capture_from_hotkey)
+        self.triggerCapture.connect(self._do_capture_from_hotkey, queued)
 
     def _do_capture_from_hotkey(self) -> None:
         """Handle capture trigger from hotkey (runs in main Qt thread)."""
-        log_debug("_do_capture_from_hotkey called")
-        if self._overlay is not None and self._overlay.isVisible():
-            if self._overlay.hotkey_enabled:
-                log_info("Triggering capture from hotkey")
-                self._overlay.capture_region()
-            else:
+        # Called for every hotkey press, so avoid attribute chains and
+        # building debug messages nobody will see
+        if self._overlay_visible and self._overlay.hotkey_enabled:
+            log_info("Triggering capture from hotkey")
+            self._capture_region_fn()
+        elif get_logger().isEnabledFor(logging.DEBUG):
+            if self._overlay_visible:
                 log_debug("Hotkey paused - toggle button is yellow")
-        else:
-            log_debug("Overlay not visible, ignoring hotkey")
+            else:
+                log_debug("Overlay not visible, ignoring hotkey")
 
     def _manual_capture(self) -> None:
         """Manually trigger capture from button."""
@@ -643,23 +905,28 @@ class MainWindow(QMainWindow):
 
     def _start_ocr_loading(self) -> None:
         """Start loading the OCR model asynchronously."""
-        engine_name = get_engine_name(self._ocr_manager.current_engine)
-        self._status_label.setText(f"Loading {engine_name}...")
+        if self._status_label is not None:
+            engine_name = get_engine_name(self._ocr_manager.current_engine)
+            self._status_label.setText(f"Loading {engine_name}...")
         self._ocr_manager.load_model_async(self._on_model_loaded)
 
     def _is_process_running(self, process_name: str) -> bool:
-        """Check if a process with the given name is already running."""
-        import subprocess
+        """
+        Check if a process with the given name is already running.
+
+        Uses psutil when installed, otherwise walks a ToolHelp32 process
+        snapshot directly, so no helper process has to be spawned.
+        """
+        target = process_name.lower()
         try:
-            # Use tasklist on Windows to check for running processes
-            result = subprocess.run(
-                ['tasklist', '/FI', f'IMAGENAME eq {process_name}', '/NH'],
-                capture_output=True,
-                text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW
+            try:
+                import psutil
+            except ImportError:
+                return target in _windows_process_names()
+            return any(
+                (proc.info['name'] or '').lower() == target
+                for proc in psutil.process_iter(['name'])
             )
-            # If the process is found, tasklist returns it; otherwise "INFO: No tasks..."
-            return process_name.lower() in result.stdout.lower()
         except Exception as e:
             log_debug(f"Failed to check if {process_name} is running: {e}")
             return False
@@ -693,11 +960,15 @@ class MainWindow(QMainWindow):
 
     def _on_model_loaded(self, success: bool, error: Optional[str]) -> None:
         """Handle OCR model load completion (may be called from background thread)."""
-        # Use QTimer to ensure we're in the main thread
-        QTimer.singleShot(0, lambda: self._update_model_status(success, error))
+        # Queued signal delivers the update on the main thread
+        self.modelLoaded.emit(success, error or "")
 
     def _update_model_status(self, success: bool, error: Optional[str]) -> None:
         """Update UI after model load (runs in main thread)."""
+        if self._status_label is None:
+            self._pending_model_status = (success, error)
+            return
+
         engine_name = get_engine_name(self._ocr_manager.current_engine)
         if success:
             self._status_label.setText(f"Ready - {engine_name} loaded")
@@ -717,6 +988,8 @@ class MainWindow(QMainWindow):
             self._overlay = CaptureWindow()
             self._overlay.captureCompleted.connect(self._on_capture)
             self._overlay.geometryChanged.connect(self._on_overlay_geometry_changed)
+            self._overlay.visibilityChanged.connect(self._on_overlay_visibility_changed)
+            self._capture_region_fn = self._overlay.capture_region
 
             # Restore saved geometry
             if self._settings.get("overlay_geometry"):
@@ -735,10 +1008,19 @@ class MainWindow(QMainWindow):
         self._show_overlay_btn.setEnabled(True)
         self._hide_overlay_btn.setEnabled(False)
 
+    def _on_overlay_visibility_changed(self, visible: bool) -> None:
+        """Track overlay visibility for the hotkey path."""
+        self._overlay_visible = visible
+
     def _on_overlay_geometry_changed(self, geometry) -> None:
-        """Save overlay geometry when it changes."""
+        """Schedule saving the overlay geometry, restarting the debounce."""
+        self._geom_save_timer.start()
+
+    def _persist_geometry(self) -> None:
+        """Store the settled overlay geometry and save settings."""
         if self._overlay:
             self._settings["overlay_geometry"] = self._overlay.save_geometry_string()
+            self._save_settings()
 
     def _on_capture(self, pil_image: Image.Image) -> None:
         """Handle captured screen region (PIL Image from overlay)."""
@@ -753,33 +1035,67 @@ class MainWindow(QMainWindow):
             self._statusbar.showMessage("Processing...")
         self._append_result("--- Processing capture... ---")
 
-        # Process in background thread
-        def process():
-            try:
-                # Get preprocessing mode
-                mode_str = self._settings.get("preprocessing_mode", "none")
-                mode = PreprocessingMode(mode_str)
-                log_debug(f"Using preprocessing mode: {mode_str}")
+        # Process on the capture pool; a capture still waiting there is replaced
+        with self._capture_lock:
+            if self._latest_capture is not None:
+                log_debug("Replacing pending capture with a newer one")
+                self._on_ocr_superseded()
+            self._latest_capture = pil_image
+            if self._capture_job_pending:
+                return
+            self._capture_job_pending = True
+        self._ocr_pool.start(self._process_pending_captures)
+
+    def _process_pending_captures(self) -> None:
+        """Process the newest pending capture until none is left (runs on the capture pool)."""
+        while True:
+            with self._capture_lock:
+                pil_image = self._latest_capture
+                self._latest_capture = None
+                if pil_image is None:
+                    self._capture_job_pending = False
+                    return
+            self._process_capture(pil_image)
+
+    def _process_capture(self, pil_image: Image.Image) -> None:
+        """Preprocess a capture and hand it to the OCR engine."""
+        try:
+            mode = self._preprocess_mode
 
-                # Preprocess
+            # "none" only converts to RGB, which screen grabs already are
+            if mode == PreprocessingMode.NONE and pil_image.mode == 'RGB':
+                processed = pil_image
+            else:
                 processed = preprocess_image(pil_image, mode)
-                log_debug(f"Preprocessed image size: {processed.size}")
 
-                # Run OCR using the manager
+            # Hand off to the OCR engine; the result arrives in _on_ocr_done
+            if get_logger().isEnabledFor(logging.DEBUG):
+                log_debug(f"Using preprocessing mode: {mode.value}")
+                log_debug(f"Preprocessed image size: {processed.size}")
                 engine_name = get_engine_name(self._ocr_manager.current_engine)
                 log_debug(f"Running OCR inference with {engine_name}...")
-                result = self._ocr_manager.perform_ocr(processed)
-                log_info(f"OCR result: {result[:50]}..." if len(result) > 50 else f"OCR result: {result}")
+            self._ocr_manager.perform_ocr_async(processed).add_done_callback(self._on_ocr_done)
 
-                # Emit result (thread-safe via signal)
-                self.ocrCompleted.emit(result)
-
-            except Exception as e:
-                log_exception(e, "_on_capture.process")
-                self.ocrError.emit(str(e))
+        except Exception as e:
+            log_exception(e, "_process_capture")
+            self.ocrError.emit(str(e))
+
+    def _on_ocr_done(self, future: Future) -> None:
+        """Emit the result of an OCR request (runs on the engine's thread)."""
+        if future.cancelled():
+            log_debug("OCR request superseded by a newer capture")
+            self.ocrSuperseded.emit()
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            log_exception(e, "_on_ocr_done")
+            self.ocrError.emit(str(e))
+            return
+        log_info(f"OCR result: {result[:50]}..." if len(result) > 50 else f"OCR result: {result}")
 
-        thread = threading.Thread(target=process, daemon=True)
-        thread.start()
+        # Emit result (thread-safe via signal)
+        self.ocrCompleted.emit(result)
 
     def _on_ocr_complete(self, text: str) -> None:
         """Handle OCR completion."""
@@ -814,6 +1130,11 @@ class MainWindow(QMainWindow):
             self._append_result("--- No text found ---")
             self._statusbar.showMessage("No text detected")
 
+    def _on_ocr_superseded(self) -> None:
+        """Close out a capture that was dropped in favour of a newer one."""
+        self._append_result("--- Superseded by a newer capture ---")
+        self._statusbar.showMessage("Previous capture superseded, processing the newest...")
+
     def _on_ocr_error(self, error: str) -> None:
         """Handle OCR error."""
         self._append_result(f"Error: {error}")
@@ -821,11 +1142,20 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, "OCR Error", f"An error occurred:\n{error}")
 
     def _append_result(self, text: str) -> None:
-        """Append text to results area."""
-        self._results_text.append(text)
+        """Queue text to be appended to the results area on the next flush."""
+        self._pending_results.append(text)
+        if not self._results_flush_timer.isActive():
+            self._results_flush_timer.start()
+
+    def _flush_results(self) -> None:
+        """Write all queued results to the results area."""
+        if self._pending_results:
+            self._results_text.append('\n'.join(self._pending_results))
+            self._pending_results.clear()
 
     def _copy_results(self) -> None:
         """Copy all results to clipboard."""
+        self._flush_results()
         text = self._results_text.toPlainText()
         if text:
             if copy_text(text):
@@ -837,12 +1167,14 @@ class MainWindow(QMainWindow):
 
     def _clear_results(self) -> None:
         """Clear the results area."""
+        self._pending_results.clear()
         self._results_text.clear()
 
     def _on_preprocess_change(self, index: int) -> None:
         """Handle preprocessing mode change."""
         mode = self._preprocess_combo.currentData()
         self._settings["preprocessing_mode"] = mode
+        self._preprocess_mode = PreprocessingMode(mode)
         log_debug(f"Preprocessing mode changed to: {mode}")
         # Check if statusbar exists (may not during initial setup)
         if self._statusbar is not None:
@@ -861,6 +1193,12 @@ class MainWindow(QMainWindow):
 
     def _apply_settings(self, settings: dict) -> None:
         """Apply new settings."""
+        # The dialog emits on Apply, on OK and again from get_settings();
+        # only a real change may re-register hotkeys or reload the engine
+        if settings == self._settings:
+            log_debug("Settings unchanged, nothing to apply")
+            return
+
         old_hotkey = self._settings.get("capture_hotkey")
         new_hotkey = settings.get("capture_hotkey")
         old_engine = self._settings.get("ocr_engine")
@@ -868,10 +1206,8 @@ class MainWindow(QMainWindow):
 
         self._settings.update(settings)
 
-        # Re-register hotkey if changed
-        if old_hotkey != new_hotkey:
-            self._setup_hotkey()
-            self._hotkey_label.setText(f"Capture hotkey: {new_hotkey}")
+        # Set before switching so the switch below already honours it
+        self._ocr_manager.keep_engines_loaded = bool(settings.get("keep_engines_loaded", False))
 
         # Switch OCR engine if changed
         if old_engine != new_engine:
@@ -894,17 +1230,81 @@ class MainWindow(QMainWindow):
         if index >= 0:
             self._preprocess_combo.setCurrentIndex(index)
 
-        # Update macro kill key
-        self._macro_manager.set_kill_key(settings.get("kill_key", "f12"))
+        # Re-register hotkeys together at the end; set_kill_key itself skips
+        # a key that is already bound
+        self._reregister_hotkeys(
+            new_hotkey if old_hotkey != new_hotkey else None,
+            settings.get("kill_key", "f12"),
+        )
+
+    def _reregister_hotkeys(self, capture_hotkey: Optional[str], kill_key: Optional[str]) -> None:
+        """
+        Apply capture hotkey and macro kill key changes in one pass.
+
+        Args:
+            capture_hotkey: New capture hotkey, or None if unchanged
+            kill_key: Macro kill key, or None to leave it alone
+        """
+        if capture_hotkey is not None:
+            self._parsed_hotkey = self._parse_hotkey(capture_hotkey or "ctrl+shift")
+            self._setup_hotkey()
+            self._hotkey_label.setText(f"Capture hotkey: {capture_hotkey}")
+
+        if kill_key is not None:
+            self._macro_manager.set_kill_key(kill_key)
 
     def _save_settings(self) -> None:
-        """Save settings to file."""
+        """
+        Save settings to file, skipping the write if nothing changed.
+
+        Serialization happens here; the disk write runs on the global
+        thread pool so a slow disk cannot stall the UI.
+        """
         try:
-            with open("ocr_settings.json", "w") as f:
-                json.dump(self._settings, f, indent=2)
-            log_info("Settings saved to ocr_settings.json")
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(self._settings, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self._settings, indent=2).encode()
         except Exception as e:
             log_error(f"Failed to save settings: {e}")
+            return
+        if data == self._saved_settings_data:
+            log_debug("Settings unchanged, not rewriting ocr_settings.json")
+            return
+        self._saved_settings_data = data
+        self._pending_settings_data = data
+        QThreadPool.globalInstance().start(self._write_pending_settings)
+
+    def _write_pending_settings(self) -> None:
+        """Write the newest pending settings (runs on a pool thread)."""
+        with self._settings_write_lock:
+            # An earlier job may already have written the newest data
+            data = self._pending_settings_data
+            self._pending_settings_data = None
+            if data is None:
+                return
+            try:
+                self._write_settings_file(data)
+                log_info("Settings saved to ocr_settings.json")
+            except Exception as e:
+                self._saved_settings_data = None  # Let the next save retry
+                log_error(f"Failed to save settings: {e}")
+
+    @staticmethod
+    def _write_settings_file(data: bytes) -> None:
+        """
+        Atomically replace ocr_settings.json with the given bytes.
+
+        The data goes to a temporary file that is fsynced and then renamed
+        over the settings file, so a crash mid-write never leaves a
+        truncated file behind.
+        """
+        tmp_file = "ocr_settings.json.tmp"
+        with open(tmp_file, "wb", buffering=65536) as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, "ocr_settings.json")
 
     def _on_tray_activated(self, reason) -> None:
         """Handle tray icon activation."""
@@ -917,6 +1317,7 @@ class MainWindow(QMainWindow):
     def _quit(self) -> None:
         """Quit the application."""
         # Save settings
+        self._geom_save_timer.stop()
         if self._overlay:
             self._settings["overlay_geometry"] = self._overlay.save_geometry_string()
         self._save_settings()
@@ -924,6 +1325,14 @@ class MainWindow(QMainWindow):
         # Unregister all hotkeys (keyboard and mouse)
         self._unregister_hotkeys()
 
+        # Let a capture that is already being preprocessed finish
+        with self._capture_lock:
+            self._latest_capture = None
+        self._ocr_pool.waitForDone(2000)
+
+        # Make sure the final settings write has reached the disk
+        QThreadPool.globalInstance().waitForDone(2000)
+
         # Hide tray icon
         if self._tray_icon:
             self._tray_icon.hide()
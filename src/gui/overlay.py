@@ -7,33 +7,44 @@ and hotkey toggle button.
 """
 
 from __future__ import annotations
+import re
 from typing import Optional, Tuple, TYPE_CHECKING
-from enum import Enum, auto
+from enum import IntEnum
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QApplication, QPushButton, QFrame
 )
 from PyQt6.QtCore import Qt, QPoint, QRect, pyqtSignal, QTimer
 from PyQt6.QtGui import (
     QPainter, QColor, QPen, QBrush, QCursor,
-    QPixmap, QScreen, QGuiApplication
+    QPixmap, QScreen, QGuiApplication, QRegion
 )
-from PIL import Image, ImageGrab
+
+from ..utils.logger import log_info, log_error
 
 if TYPE_CHECKING:
+    from PIL import Image
     from PyQt6.QtGui import QMouseEvent, QPaintEvent
 
+# Geometry strings as written by save_geometry_string: "WxH+X+Y"
+_GEOM_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
+
+
+class ResizeEdge(IntEnum):
+    """
+    Edges and corners for resize detection.
 
-class ResizeEdge(Enum):
-    """Edges and corners for resize detection."""
-    NONE = auto()
-    TOP = auto()
-    BOTTOM = auto()
-    LEFT = auto()
-    RIGHT = auto()
-    TOP_LEFT = auto()
-    TOP_RIGHT = auto()
-    BOTTOM_LEFT = auto()
-    BOTTOM_RIGHT = auto()
+    Each side is one bit and a corner is its two sides ORed together, so
+    resize code can test sides with & instead of membership checks.
+    """
+    NONE = 0
+    RIGHT = 1
+    LEFT = 2
+    BOTTOM = 4
+    TOP = 8
+    BOTTOM_RIGHT = 5
+    BOTTOM_LEFT = 6
+    TOP_RIGHT = 9
+    TOP_LEFT = 10
 
 
 class CaptureWindow(QMainWindow):
@@ -51,17 +62,91 @@ class CaptureWindow(QMainWindow):
     # Signals
     captureCompleted = pyqtSignal(object)  # Emits PIL Image
     geometryChanged = pyqtSignal(QRect)
+    visibilityChanged = pyqtSignal(bool)  # True when shown, False when hidden
 
     # Constants
     BORDER_WIDTH = 2
     RESIZE_MARGIN = 8
     MIN_SIZE = 35
+    GEOMETRY_FLUSH_MS = 16  # Apply drag/resize geometry at most once per frame
+    CAPTURE_SETTLE_MS = 16  # One compositor frame for the hidden overlay to leave the screen
     OVERLAY_ALPHA = 0.25  # 25% opacity like original
 
     # Colors matching original
     BORDER_COLOR = QColor(255, 0, 0)  # Red border
     INTERIOR_COLOR = QColor(0, 0, 0)  # Black interior
 
+    # Resize edge for each (top, bottom, left, right) hit combination, keyed
+    # by top<<3 | bottom<<2 | left<<1 | right, which is the edge's own value
+    # for real edges. Combinations that need a tiny window keep the old
+    # precedence: corners first, then left/right/top/bottom.
+    _EDGE_LUT = (
+        ResizeEdge.NONE,          # 0000
+        ResizeEdge.RIGHT,         # 0001
+        ResizeEdge.LEFT,          # 0010
+        ResizeEdge.LEFT,          # 0011
+        ResizeEdge.BOTTOM,        # 0100
+        ResizeEdge.BOTTOM_RIGHT,  # 0101
+        ResizeEdge.BOTTOM_LEFT,   # 0110
+        ResizeEdge.BOTTOM_LEFT,   # 0111
+        ResizeEdge.TOP,           # 1000
+        ResizeEdge.TOP_RIGHT,     # 1001
+        ResizeEdge.TOP_LEFT,      # 1010
+        ResizeEdge.TOP_LEFT,      # 1011
+        ResizeEdge.TOP,           # 1100
+        ResizeEdge.TOP_RIGHT,     # 1101
+        ResizeEdge.TOP_LEFT,      # 1110
+        ResizeEdge.TOP_LEFT,      # 1111
+    )
+
+    # Cursor per resize edge, indexed by ResizeEdge value; unused slots
+    # (opposite sides together) are never looked up
+    _CURSOR_TABLE = (
+        Qt.CursorShape.ArrowCursor,      # 0000 NONE
+        Qt.CursorShape.SizeHorCursor,    # 0001 RIGHT
+        Qt.CursorShape.SizeHorCursor,    # 0010 LEFT
+        Qt.CursorShape.ArrowCursor,      # 0011
+        Qt.CursorShape.SizeVerCursor,    # 0100 BOTTOM
+        Qt.CursorShape.SizeFDiagCursor,  # 0101 BOTTOM_RIGHT
+        Qt.CursorShape.SizeBDiagCursor,  # 0110 BOTTOM_LEFT
+        Qt.CursorShape.ArrowCursor,      # 0111
+        Qt.CursorShape.SizeVerCursor,    # 1000 TOP
+        Qt.CursorShape.SizeBDiagCursor,  # 1001 TOP_RIGHT
+        Qt.CursorShape.SizeFDiagCursor,  # 1010 TOP_LEFT
+        Qt.CursorShape.ArrowCursor,      # 1011
+        Qt.CursorShape.ArrowCursor,      # 1100
+        Qt.CursorShape.ArrowCursor,      # 1101
+        Qt.CursorShape.ArrowCursor,      # 1110
+        Qt.CursorShape.ArrowCursor,      # 1111
+    )
+
+    # Toggle button: red = hotkey active, yellow = hotkey paused
+    TOGGLE_SIZE = 24
+    _ACTIVE_QSS = """
+        QPushButton {
+            background-color: red;
+            color: white;
+            border: none;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton:hover {
+            background-color: #cc0000;
+        }
+    """
+    _PAUSED_QSS = """
+        QPushButton {
+            background-color: yellow;
+            color: black;
+            border: none;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton:hover {
+            background-color: #cccc00;
+        }
+    """
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """Initialize the capture overlay window."""
         super().__init__(parent)
@@ -71,9 +156,26 @@ class CaptureWindow(QMainWindow):
         self._resizing = False
         self._drag_start: Optional[QPoint] = None
         self._resize_edge = ResizeEdge.NONE
+        self._last_cursor_edge = ResizeEdge.NONE  # Edge whose cursor is currently set
         self._initial_geometry: Optional[QRect] = None
+        self._last_wh: Optional[Tuple[int, int]] = None  # Size the interior was last laid out for
         self._hotkey_enabled = True  # Hotkey toggle state
 
+        # Drag/resize geometry is coalesced and applied by a frame timer
+        self._pending_geo: Optional[QRect] = None
+        self._geo_timer = QTimer(self)
+        self._geo_timer.setInterval(self.GEOMETRY_FLUSH_MS)
+        self._geo_timer.timeout.connect(self._flush_geometry)
+
+        # Union of all screen geometries, rebuilt lazily after screen changes
+        self._screen_union: Optional[QRegion] = None
+        app = QGuiApplication.instance()
+        if app is not None:
+            app.screenAdded.connect(self._on_screen_added)
+            app.screenRemoved.connect(self._invalidate_screens)
+            for screen in QGuiApplication.screens():
+                screen.geometryChanged.connect(self._invalidate_screens)
+
         self._setup_window()
         self._setup_ui()
 
@@ -116,20 +218,10 @@ class CaptureWindow(QMainWindow):
         # Toggle button in top-right corner
         # Red = hotkey active, Yellow = hotkey paused
         self._toggle_btn = QPushButton("停", self)
-        self._toggle_btn.setFixedSize(24, 24)
+        self._toggle_btn.setFixedSize(self.TOGGLE_SIZE, self.TOGGLE_SIZE)
         self._toggle_btn.clicked.connect(self._toggle_hotkey)
-        self._toggle_btn.setStyleSheet("""
-            QPushButton {
-                background-color: red;
-                color: white;
-                border: none;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #cc0000;
-            }
-        """)
+        self._toggle_btn.setStyleSheet(self._ACTIVE_QSS)
+        self._toggle_btn.raise_()  # Keep on top; no siblings are added later
 
         # Position elements
         self._update_interior_geometry()
@@ -139,56 +231,38 @@ class CaptureWindow(QMainWindow):
         super().resizeEvent(event)
         self._update_interior_geometry()
 
+    def showEvent(self, event) -> None:
+        """Report the overlay becoming visible."""
+        super().showEvent(event)
+        self.visibilityChanged.emit(True)
+
+    def hideEvent(self, event) -> None:
+        """Report the overlay being hidden (including during a capture)."""
+        super().hideEvent(event)
+        self.visibilityChanged.emit(False)
+
     def _update_interior_geometry(self) -> None:
         """Update interior frame and button positions."""
+        # Both depend only on the window size, which a move leaves alone
+        w, h = self.width(), self.height()
+        if (w, h) == self._last_wh:
+            return
+        self._last_wh = (w, h)
+
         # Interior frame fills window minus border
         margin = self.BORDER_WIDTH
-        self._interior.setGeometry(
-            margin, margin,
-            self.width() - 2 * margin,
-            self.height() - 2 * margin
-        )
+        self._interior.setGeometry(margin, margin, w - 2 * margin, h - 2 * margin)
 
         # Position toggle button in top-right corner
         btn_margin = 5
-        self._toggle_btn.move(
-            self.width() - self._toggle_btn.width() - btn_margin,
-            btn_margin
-        )
-        self._toggle_btn.raise_()  # Keep on top
+        self._toggle_btn.move(w - self.TOGGLE_SIZE - btn_margin, btn_margin)
 
     def _toggle_hotkey(self) -> None:
         """Toggle the hotkey capture on/off."""
         self._hotkey_enabled = not self._hotkey_enabled
 
-        if self._hotkey_enabled:
-            self._toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: red;
-                    color: white;
-                    border: none;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #cc0000;
-                }
-            """)
-            print("Hotkey capture active")
-        else:
-            self._toggle_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: yellow;
-                    color: black;
-                    border: none;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #cccc00;
-                }
-            """)
-            print("Hotkey capture paused")
+        self._toggle_btn.setStyleSheet(self._ACTIVE_QSS if self._hotkey_enabled else self._PAUSED_QSS)
+        log_info("Hotkey capture active" if self._hotkey_enabled else "Hotkey capture paused")
 
     @property
     def hotkey_enabled(self) -> bool:
@@ -221,9 +295,9 @@ class CaptureWindow(QMainWindow):
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         """Handle mouse move for dragging, resizing, and cursor updates."""
         if self._dragging and self._drag_start is not None:
-            # Move window
+            # Move window (applied on the next geometry flush)
             new_pos = event.globalPosition().toPoint() - self._drag_start
-            self.move(new_pos)
+            self._set_pending_geometry(QRect(new_pos, self.size()))
 
         elif self._resizing:
             # Resize window incrementally (like original Tkinter version)
@@ -239,6 +313,7 @@ class CaptureWindow(QMainWindow):
         """Handle mouse release."""
         if event.button() == Qt.MouseButton.LeftButton:
             if self._dragging or self._resizing:
+                self._flush_geometry()
                 self.geometryChanged.emit(self.geometry())
 
             self._dragging = False
@@ -261,42 +336,17 @@ class CaptureWindow(QMainWindow):
         x = pos.x()
         y = pos.y()
 
-        # Check corners first (they take priority)
-        if x < m and y < m:
-            return ResizeEdge.TOP_LEFT
-        if x > w - m and y < m:
-            return ResizeEdge.TOP_RIGHT
-        if x < m and y > h - m:
-            return ResizeEdge.BOTTOM_LEFT
-        if x > w - m and y > h - m:
-            return ResizeEdge.BOTTOM_RIGHT
-
-        # Check edges
-        if x < m:
-            return ResizeEdge.LEFT
-        if x > w - m:
-            return ResizeEdge.RIGHT
-        if y < m:
-            return ResizeEdge.TOP
-        if y > h - m:
-            return ResizeEdge.BOTTOM
-
-        return ResizeEdge.NONE
+        # One table lookup instead of a chain of corner/edge checks
+        key = ((y < m) << 3) | ((y > h - m) << 2) | ((x < m) << 1) | (x > w - m)
+        return self._EDGE_LUT[key]
 
     def _update_cursor(self, edge: ResizeEdge) -> None:
         """Update cursor based on resize edge."""
-        cursors = {
-            ResizeEdge.NONE: Qt.CursorShape.ArrowCursor,
-            ResizeEdge.TOP: Qt.CursorShape.SizeVerCursor,
-            ResizeEdge.BOTTOM: Qt.CursorShape.SizeVerCursor,
-            ResizeEdge.LEFT: Qt.CursorShape.SizeHorCursor,
-            ResizeEdge.RIGHT: Qt.CursorShape.SizeHorCursor,
-            ResizeEdge.TOP_LEFT: Qt.CursorShape.SizeFDiagCursor,
-            ResizeEdge.BOTTOM_RIGHT: Qt.CursorShape.SizeFDiagCursor,
-            ResizeEdge.TOP_RIGHT: Qt.CursorShape.SizeBDiagCursor,
-            ResizeEdge.BOTTOM_LEFT: Qt.CursorShape.SizeBDiagCursor,
-        }
-        self.setCursor(cursors.get(edge, Qt.CursorShape.ArrowCursor))
+        # setCursor goes to the windowing system, so only call it on change
+        if edge is self._last_cursor_edge:
+            return
+        self._last_cursor_edge = edge
+        self.setCursor(self._CURSOR_TABLE[edge])
 
     def _do_resize(self, global_pos: QPoint) -> None:
         """
@@ -307,11 +357,11 @@ class CaptureWindow(QMainWindow):
         - Calculate dx/dy relative to current window position
         - Apply changes independently per axis
         """
-        # Get current geometry (not initial - this is key!)
-        x = self.x()
-        y = self.y()
-        w = self.width()
-        h = self.height()
+        # Get current geometry (not initial - this is key!), including
+        # any step that has not been applied to the window yet
+        geo = self._pending_geo if self._pending_geo is not None else self.geometry()
+        x, y, w, h = geo.x(), geo.y(), geo.width(), geo.height()
+        edge = self._resize_edge
 
         # Calculate mouse position relative to window origin
         # This matches Tkinter's event.x_root - self.winfo_rootx()
@@ -319,15 +369,15 @@ class CaptureWindow(QMainWindow):
         dy = global_pos.y() - y
 
         # East edge: width = mouse x position relative to window
-        if self._resize_edge in (ResizeEdge.RIGHT, ResizeEdge.TOP_RIGHT, ResizeEdge.BOTTOM_RIGHT):
+        if edge & ResizeEdge.RIGHT:
             w = max(self.MIN_SIZE, dx)
 
         # South edge: height = mouse y position relative to window
-        if self._resize_edge in (ResizeEdge.BOTTOM, ResizeEdge.BOTTOM_LEFT, ResizeEdge.BOTTOM_RIGHT):
+        if edge & ResizeEdge.BOTTOM:
             h = max(self.MIN_SIZE, dy)
 
         # West edge: need to move x and adjust width
-        if self._resize_edge in (ResizeEdge.LEFT, ResizeEdge.TOP_LEFT, ResizeEdge.BOTTOM_LEFT):
+        if edge & ResizeEdge.LEFT:
             new_w = w - dx
             if new_w >= self.MIN_SIZE:
                 w = new_w
@@ -337,7 +387,7 @@ class CaptureWindow(QMainWindow):
                 w = self.MIN_SIZE
 
         # North edge: need to move y and adjust height
-        if self._resize_edge in (ResizeEdge.TOP, ResizeEdge.TOP_LEFT, ResizeEdge.TOP_RIGHT):
+        if edge & ResizeEdge.TOP:
             new_h = h - dy
             if new_h >= self.MIN_SIZE:
                 h = new_h
@@ -346,29 +396,39 @@ class CaptureWindow(QMainWindow):
                 # Clamp to minimum - don't move y
                 h = self.MIN_SIZE
 
-        self.setGeometry(x, y, w, h)
+        self._set_pending_geometry(QRect(x, y, w, h))
+
+    def _set_pending_geometry(self, rect: QRect) -> None:
+        """Queue a geometry change for the next flush."""
+        self._pending_geo = rect
+        if not self._geo_timer.isActive():
+            self._geo_timer.start()
+
+    def _flush_geometry(self) -> None:
+        """Apply the last queued geometry, stopping the timer when idle."""
+        if self._pending_geo is None:
+            self._geo_timer.stop()
+            return
+        geo = self._pending_geo
+        self._pending_geo = None
+        self.setGeometry(geo)
 
     def capture_region(self) -> None:
         """
         Capture the screen region covered by this overlay.
 
-        Uses PIL ImageGrab for better Windows multi-monitor support.
+        Grabs the region from its screen, falling back to PIL ImageGrab
+        for regions spanning several monitors.
         Hides the overlay, captures the screen, then shows it again.
         Emits captureCompleted signal with the captured PIL Image.
         """
         if not self._hotkey_enabled:
-            print("Hotkey is paused. Click toggle button to enable.")
+            log_info("Hotkey is paused. Click toggle button to enable.")
             return
 
-        # Get interior frame coordinates (the actual capture area)
-        # Use window geometry plus border offset
-        geo = self.geometry()
+        # Interior frame (the actual capture area): window geometry inset by the border
         border = self.BORDER_WIDTH
-
-        x1 = geo.x() + border
-        y1 = geo.y() + border
-        x2 = geo.x() + geo.width() - border
-        y2 = geo.y() + geo.height() - border
+        capture_rect = self.geometry().adjusted(border, border, -border, -border)
 
         # Hide overlay
         self.hide()
@@ -376,31 +436,64 @@ class CaptureWindow(QMainWindow):
         # Force the hide to take effect
         QApplication.processEvents()
 
-        # Small delay to ensure screen updates (like original's 50ms)
-        QTimer.singleShot(50, lambda: self._do_capture(x1, y1, x2, y2))
+        # Give the compositor one frame to drop the overlay from the screen
+        QTimer.singleShot(self.CAPTURE_SETTLE_MS, lambda: self._do_capture(capture_rect))
 
-    def _do_capture(self, x1: int, y1: int, x2: int, y2: int) -> None:
-        """Perform the actual screen capture using PIL ImageGrab."""
+    def _do_capture(self, rect: QRect) -> None:
+        """Perform the actual screen capture of the given global rect."""
         screenshot = None
         try:
-            # Use PIL ImageGrab for better Windows/multi-monitor support
-            try:
-                screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2), all_screens=True)
-            except TypeError:
-                # Fallback for systems that don't support all_screens
-                screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+            # Grab just the region from its screen; fall back to PIL
+            # ImageGrab for regions spanning monitors or failed grabs
+            screenshot = self._grab_from_screen(rect)
+            if screenshot is None:
+                # PIL is only needed once something is actually captured
+                from PIL import ImageGrab
+
+                x1, y1 = rect.x(), rect.y()
+                x2, y2 = x1 + rect.width(), y1 + rect.height()
+                try:
+                    screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2), all_screens=True)
+                except TypeError:
+                    # Fallback for systems that don't support all_screens
+                    screenshot = ImageGrab.grab(bbox=(x1, y1, x2, y2))
 
             if screenshot:
                 # Emit the captured image as PIL Image
                 self.captureCompleted.emit(screenshot)
 
         except Exception as e:
-            print(f"Capture error: {e}")
+            log_error(f"Capture error: {e}")
 
         finally:
             # Show overlay again
             self.show()
 
+    def _grab_from_screen(self, rect: QRect) -> Optional[Image.Image]:
+        """
+        Capture the region with QScreen.grabWindow.
+
+        Only the requested rectangle is read, rather than the whole virtual
+        desktop, and the result is at the screen's native resolution.
+
+        Returns:
+            RGB PIL Image, or None if no single screen contains the region
+            or the platform refused the grab
+        """
+        screen = QGuiApplication.screenAt(rect.topLeft())
+        if screen is None:
+            return None
+        screen_geo = screen.geometry()
+        if not screen_geo.contains(rect):
+            return None
+
+        pixmap = screen.grabWindow(
+            0, rect.x() - screen_geo.x(), rect.y() - screen_geo.y(), rect.width(), rect.height()
+        )
+        if pixmap.isNull():
+            return None
+        return pixmap_to_pil(pixmap, 'RGB')
+
     def get_capture_rect(self) -> Tuple[int, int, int, int]:
         """Get the capture region as (x, y, width, height)."""
         geo = self.geometry()
@@ -425,40 +518,45 @@ class CaptureWindow(QMainWindow):
         Returns:
             True if successfully restored
         """
-        try:
-            # Parse "WxH+X+Y" format
-            parts = geometry_str.replace('x', '+').split('+')
-            if len(parts) >= 4:
-                w, h, x, y = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
+        match = _GEOM_RE.match(geometry_str)
+        if match is None:
+            return False
+        w, h, x, y = map(int, match.groups())
 
-                # Validate position is on screen
-                if self._is_position_valid(x, y, w, h):
-                    self.setGeometry(x, y, max(w, self.MIN_SIZE), max(h, self.MIN_SIZE))
-                    return True
-
-        except (ValueError, IndexError):
-            pass
+        # Validate position is on screen
+        if self._is_position_valid(x, y, w, h):
+            self.setGeometry(x, y, max(w, self.MIN_SIZE), max(h, self.MIN_SIZE))
+            return True
 
         return False
 
     def _is_position_valid(self, x: int, y: int, w: int, h: int) -> bool:
         """Check if the given position is visible on any screen."""
-        rect = QRect(x, y, w, h)
-        for screen in QGuiApplication.screens():
-            if screen.geometry().intersects(rect):
-                return True
-        return False
+        if self._screen_union is None:
+            union = QRegion()
+            for screen in QGuiApplication.screens():
+                union = union.united(QRegion(screen.geometry()))
+            self._screen_union = union
+        return self._screen_union.intersects(QRect(x, y, w, h))
 
+    def _on_screen_added(self, screen: QScreen) -> None:
+        """Track a newly connected screen."""
+        screen.geometryChanged.connect(self._invalidate_screens)
+        self._invalidate_screens()
 
-def pixmap_to_pil(pixmap: QPixmap) -> Image.Image:
-    """Convert QPixmap to PIL Image."""
-    qimage = pixmap.toImage()
-    qimage = qimage.convertToFormat(qimage.Format.Format_RGBA8888)
+    def _invalidate_screens(self, *args) -> None:
+        """Drop the cached screen union after a screen change."""
+        self._screen_union = None
 
-    width = qimage.width()
-    height = qimage.height()
 
-    ptr = qimage.bits()
-    ptr.setsize(qimage.sizeInBytes())
+def pixmap_to_pil(pixmap: QPixmap, mode: str = 'RGBA') -> Image.Image:
+    """
+    Convert QPixmap to PIL Image.
+
+    Args:
+        pixmap: Pixmap to convert
+        mode: PIL mode of the result, 'RGBA' or 'RGB'
+    """
+    from ..utils.image_ops import qimage_to_pil
 
-    return Image.frombytes('RGBA', (width, height), bytes(ptr), 'raw', 'RGBA')
+    return qimage_to_pil(pixmap.toImage(), mode)
@@ -6,17 +6,18 @@ and macro management.
 """
 
 from __future__ import annotations
+import contextlib
+import functools
 import os
-import subprocess
+import sys
 from typing import Optional, Callable
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLabel, QPushButton, QLineEdit, QComboBox,
     QCheckBox, QSlider, QSpinBox, QTabWidget,
-    QWidget, QFormLayout, QMessageBox, QTextEdit,
-    QFileDialog
+    QWidget, QFormLayout, QMessageBox, QTextEdit
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QKeySequence
 
 from ..utils.logger import log_info, log_error, log_debug
@@ -24,6 +25,49 @@ from ..utils.image_ops import PreprocessingMode, get_available_modes, mode_descr
 from ..core.ocr_manager import OCREngine, get_engine_name, get_engine_description
 
 
+@contextlib.contextmanager
+def _block_signals(*widgets: QWidget):
+    """Block signals on the given widgets for the duration of the block."""
+    previous = [widget.blockSignals(True) for widget in widgets]
+    try:
+        yield
+    finally:
+        for widget, was_blocked in zip(widgets, previous):
+            widget.blockSignals(was_blocked)
+
+
+@functools.lru_cache(maxsize=1)
+def _user_home() -> str:
+    """Get the user's home directory (resolved once per process)."""
+    return os.path.expanduser('~')
+
+
+@functools.lru_cache(maxsize=1)
+def _japreader_candidate_paths() -> tuple:
+    """Get common japReader installation paths to check (built once)."""
+    # Common installation locations
+    program_files = os.environ.get('PROGRAMFILES', 'C:\\Program Files')
+    program_files_x86 = os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')
+    local_appdata = os.environ.get('LOCALAPPDATA', '')
+    appdata = os.environ.get('APPDATA', '')
+    user_home = _user_home()
+
+    # japReader possible locations
+    return (
+        os.path.join(program_files, 'japReader', 'japReader.exe'),
+        os.path.join(program_files_x86, 'japReader', 'japReader.exe'),
+        os.path.join(local_appdata, 'japReader', 'japReader.exe'),
+        os.path.join(appdata, 'japReader', 'japReader.exe'),
+        os.path.join(user_home, 'japReader', 'japReader.exe'),
+        os.path.join(local_appdata, 'Programs', 'japReader', 'japReader.exe'),
+        # GitHub releases often extract to Downloads or Desktop
+        os.path.join(user_home, 'Downloads', 'japReader', 'japReader.exe'),
+        os.path.join(user_home, 'Desktop', 'japReader', 'japReader.exe'),
+        # Portable installation in same directory as this app
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'japReader', 'japReader.exe'),
+    )
+
+
 class HotkeyEdit(QLineEdit):
     """
     Custom line edit for recording keyboard shortcuts and mouse buttons.
@@ -41,14 +85,49 @@ class HotkeyEdit(QLineEdit):
         Qt.MouseButton.ForwardButton: "mouse5",  # Forward/XButton2
     }
 
+    # Hotkey tokens that name a mouse button
+    _MOUSE_TOKENS = frozenset(MOUSE_BUTTON_NAMES.values())
+
+    # Modifier-only keys, which never become the hotkey's key
+    _MODIFIER_KEYS = frozenset({
+        Qt.Key.Key_Control, Qt.Key.Key_Alt, Qt.Key.Key_Shift,
+        Qt.Key.Key_Meta, Qt.Key.Key_AltGr
+    })
+
+    # Special keys
+    _SPECIAL_KEYS = {
+        Qt.Key.Key_Space: "space",
+        Qt.Key.Key_Return: "enter",
+        Qt.Key.Key_Enter: "enter",
+        Qt.Key.Key_Tab: "tab",
+        Qt.Key.Key_Escape: "esc",
+        Qt.Key.Key_Backspace: "backspace",
+        Qt.Key.Key_Delete: "delete",
+        Qt.Key.Key_Up: "up",
+        Qt.Key.Key_Down: "down",
+        Qt.Key.Key_Left: "left",
+        Qt.Key.Key_Right: "right",
+        Qt.Key.Key_Home: "home",
+        Qt.Key.Key_End: "end",
+        Qt.Key.Key_PageUp: "pageup",
+        Qt.Key.Key_PageDown: "pagedown",
+        Qt.Key.Key_Insert: "insert",
+    }
+
+    # Names of regular keys already resolved through QKeySequence
+    _key_name_cache: dict = {}
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._recording = False
         self._modifiers = set()
         self._key = ""
         self._is_mouse_button = False
+        self._last_rendered: Optional[tuple] = None  # (modifiers, key) last shown while recording
         self.setReadOnly(True)
         self.setPlaceholderText("Click to record hotkey or mouse button...")
+        # Parsed once; recording only flips the "recording" property
+        self.setStyleSheet('HotkeyEdit[recording="true"] { background-color: #ffe0e0; }')
 
     def mousePressEvent(self, event) -> None:
         """Handle mouse press - start recording or capture mouse button."""
@@ -73,12 +152,14 @@ class HotkeyEdit(QLineEdit):
         self._modifiers.clear()
         self._key = ""
         self._is_mouse_button = False
+        self._last_rendered = None
         self.setText("Press key or mouse button...")
-        self.setStyleSheet("background-color: #ffe0e0;")
+        self._set_recording_style(True)
 
     def keyPressEvent(self, event) -> None:
         """Record key presses."""
-        if not self._recording:
+        # Autorepeat of a held key adds nothing to the recorded hotkey
+        if not self._recording or event.isAutoRepeat():
             return
 
         key = event.key()
@@ -99,24 +180,37 @@ class HotkeyEdit(QLineEdit):
         if key_name:
             self._key = key_name
 
-        # Update display
-        self._update_display()
+        # Update display only if the recorded combination changed
+        rendered = (frozenset(self._modifiers), self._key)
+        if rendered != self._last_rendered:
+            self._last_rendered = rendered
+            self._update_display()
 
     def keyReleaseEvent(self, event) -> None:
         """Finish recording on key release."""
+        # Autorepeat sends synthetic releases while the key is still held
+        if event.isAutoRepeat():
+            return
         if self._recording and self._key:
             self._stop_recording()
 
     def _stop_recording(self) -> None:
         """Finish recording and emit the hotkey."""
         self._recording = False
-        self.setStyleSheet("")
+        self._set_recording_style(False)
 
         if self._modifiers or self._key:
             hotkey = self._build_hotkey_string()
             self.setText(hotkey)
             self.hotkeyChanged.emit(hotkey)
 
+    def _set_recording_style(self, recording: bool) -> None:
+        """Toggle the recording highlight by re-polishing, not restyling."""
+        self.setProperty("recording", recording)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
     def _update_display(self) -> None:
         """Update the displayed hotkey string."""
         self.setText(self._build_hotkey_string())
@@ -139,59 +233,51 @@ class HotkeyEdit(QLineEdit):
 
     def is_mouse_hotkey(self) -> bool:
         """Check if the current hotkey is a mouse button."""
-        hotkey = self.text().lower()
-        return any(mb in hotkey for mb in ["mouse4", "mouse5", "middle"])
+        return not self._MOUSE_TOKENS.isdisjoint(self.text().lower().split("+"))
 
     def _key_to_string(self, key: int) -> str:
         """Convert Qt key code to string."""
         # Skip modifier-only keys
-        modifier_keys = {
-            Qt.Key.Key_Control, Qt.Key.Key_Alt, Qt.Key.Key_Shift,
-            Qt.Key.Key_Meta, Qt.Key.Key_AltGr
-        }
-        if key in modifier_keys:
+        if key in self._MODIFIER_KEYS:
             return ""
 
-        # Special keys
-        special_keys = {
-            Qt.Key.Key_Space: "space",
-            Qt.Key.Key_Return: "enter",
-            Qt.Key.Key_Enter: "enter",
-            Qt.Key.Key_Tab: "tab",
-            Qt.Key.Key_Escape: "esc",
-            Qt.Key.Key_Backspace: "backspace",
-            Qt.Key.Key_Delete: "delete",
-            Qt.Key.Key_Up: "up",
-            Qt.Key.Key_Down: "down",
-            Qt.Key.Key_Left: "left",
-            Qt.Key.Key_Right: "right",
-            Qt.Key.Key_Home: "home",
-            Qt.Key.Key_End: "end",
-            Qt.Key.Key_PageUp: "pageup",
-            Qt.Key.Key_PageDown: "pagedown",
-            Qt.Key.Key_Insert: "insert",
-        }
-
-        if key in special_keys:
-            return special_keys[key]
+        special = self._SPECIAL_KEYS.get(key)
+        if special:
+            return special
 
         # Function keys
         if Qt.Key.Key_F1 <= key <= Qt.Key.Key_F12:
             return f"f{key - Qt.Key.Key_F1 + 1}"
 
-        # Regular keys
-        seq = QKeySequence(key)
-        text = seq.toString().lower()
-        return text if len(text) == 1 else ""
+        # Letters and digits map straight from their key codes
+        if Qt.Key.Key_A <= key <= Qt.Key.Key_Z:
+            return chr(ord('a') + key - Qt.Key.Key_A)
+        if Qt.Key.Key_0 <= key <= Qt.Key.Key_9:
+            return chr(ord('0') + key - Qt.Key.Key_0)
+
+        # Other printable keys
+        name = self._key_name_cache.get(key)
+        if name is None:
+            text = QKeySequence(key).toString().lower()
+            name = text if len(text) == 1 else ""
+            self._key_name_cache[key] = name
+        return name
 
     def set_hotkey(self, hotkey: str) -> None:
         """Set the displayed hotkey."""
         self.setText(hotkey)
         parts = hotkey.lower().split("+")
-        self._modifiers = {p for p in parts if p in ("ctrl", "alt", "shift", "win")}
-        self._key = next((p for p in parts if p not in self._modifiers), "")
+        modifiers = set()
+        key = ""
+        for part in parts:
+            if part in ("ctrl", "alt", "shift", "win"):
+                modifiers.add(part)
+            elif not key:
+                key = part
+        self._modifiers = modifiers
+        self._key = key
         # Check if it's a mouse button
-        self._is_mouse_button = any(mb in hotkey.lower() for mb in ["mouse4", "mouse5", "middle"])
+        self._is_mouse_button = not self._MOUSE_TOKENS.isdisjoint(parts)
 
     def get_hotkey(self) -> str:
         """Get the current hotkey string."""
@@ -209,6 +295,10 @@ class SettingsDialog(QDialog):
     """
 
     settingsChanged = pyqtSignal(dict)
+    japreaderDetected = pyqtSignal(str, str)  # (path, source) from the detection thread; empty path if not found
+
+    # Last auto-detected japReader path, shared by dialogs in this session
+    _cached_japreader_path: Optional[str] = None
 
     def __init__(
         self,
@@ -216,9 +306,14 @@ class SettingsDialog(QDialog):
         parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent)
-        self._settings = current_settings.copy()
+        self._settings = dict(current_settings)
+        # Values as last emitted (or as given); only differences are emitted
+        self._emitted = dict(current_settings)
+        # Set when a control changes; _apply_settings does nothing while clear
+        self._dirty = False
         self._setup_ui()
         self._load_settings()
+        self._dirty = False
 
     def _setup_ui(self) -> None:
         """Set up the dialog UI."""
@@ -227,13 +322,21 @@ class SettingsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
-        # Tab widget
-        tabs = QTabWidget()
-        tabs.addTab(self._create_general_tab(), "General")
-        tabs.addTab(self._create_macro_tab(), "Macros")
-        tabs.addTab(self._create_integrations_tab(), "Integrations")
-        tabs.addTab(self._create_about_tab(), "About")
-        layout.addWidget(tabs)
+        # Tab widget; only General is built up front, the other tabs are
+        # built (and loaded from settings) the first time they are selected
+        self._tabs = QTabWidget()
+        self._tabs.addTab(self._create_general_tab(), "General")
+        self._tab_builders = {
+            1: (self._create_macro_tab, self._load_macro_settings),
+            2: (self._create_integrations_tab, self._load_integrations_settings),
+            3: (self._create_about_tab, None),
+        }
+        for label in ("Macros", "Integrations", "About"):
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self._tabs.addTab(placeholder, label)
+        self._tabs.currentChanged.connect(self._ensure_tab_built)
+        layout.addWidget(self._tabs)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -253,6 +356,35 @@ class SettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _ensure_tab_built(self, index: int) -> None:
+        """Build a tab's contents the first time it is selected."""
+        entry = self._tab_builders.pop(index, None)
+        if entry is None:
+            return
+        builder, loader = entry
+        self._tabs.widget(index).layout().addWidget(builder())
+        if loader is not None:
+            # Loading saved values into the controls is not a user change
+            dirty = self._dirty
+            loader()
+            self._dirty = dirty
+
+    def _mark_dirty(self, *_args) -> None:
+        """Note that a control changed since settings were last applied."""
+        self._dirty = True
+
+    def _track_changes(self, *controls: QWidget) -> None:
+        """Mark the dialog dirty whenever one of the given controls changes."""
+        for control in controls:
+            if isinstance(control, HotkeyEdit):
+                control.hotkeyChanged.connect(self._mark_dirty)
+            elif isinstance(control, QComboBox):
+                control.currentIndexChanged.connect(self._mark_dirty)
+            elif isinstance(control, QCheckBox):
+                control.toggled.connect(self._mark_dirty)
+            elif isinstance(control, QLineEdit):
+                control.textChanged.connect(self._mark_dirty)
+
     def _create_general_tab(self) -> QWidget:
         """Create the general settings tab."""
         widget = QWidget()
@@ -279,8 +411,10 @@ class SettingsDialog(QDialog):
         engine_layout = QFormLayout(engine_group)
 
         self._engine_combo = QComboBox()
+        self._engine_descriptions = {}
         for engine in OCREngine:
             self._engine_combo.addItem(get_engine_name(engine), engine.value)
+            self._engine_descriptions[engine.value] = get_engine_description(engine)
         self._engine_combo.currentIndexChanged.connect(self._on_engine_change)
         engine_layout.addRow("Engine:", self._engine_combo)
 
@@ -297,6 +431,12 @@ class SettingsDialog(QDialog):
         engine_note.setWordWrap(True)
         engine_layout.addRow(engine_note)
 
+        self._keep_engines_loaded_cb = QCheckBox("Keep models loaded when switching engines")
+        self._keep_engines_loaded_cb.setToolTip(
+            "Switching back to an engine is instant, but both models stay in memory"
+        )
+        engine_layout.addRow(self._keep_engines_loaded_cb)
+
         layout.addWidget(engine_group)
 
         # Preprocessing settings
@@ -335,6 +475,12 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(behavior_group)
 
+        self._track_changes(
+            self._hotkey_edit, self._engine_combo, self._keep_engines_loaded_cb,
+            self._preprocess_combo, self._auto_copy_cb, self._show_notification_cb,
+            self._start_minimized_cb,
+        )
+
         layout.addStretch()
         return widget
 
@@ -391,6 +537,8 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(safety_group)
 
+        self._track_changes(self._macro_enabled_cb, self._kill_key_edit)
+
         layout.addStretch()
         return widget
 
@@ -441,75 +589,77 @@ class SettingsDialog(QDialog):
 
         layout.addWidget(japreader_group)
 
-        # Detect japReader on tab creation
-        self._detect_japreader()
+        self._track_changes(self._japreader_autolaunch_cb, self._japreader_path_edit)
+
+        # Detect japReader once the tab has painted; probing runs off the UI thread
+        self._japreader_status_label.setText("Detecting japReader...")
+        self._japreader_launch_btn.setEnabled(False)
+        QTimer.singleShot(0, self._detect_japreader)
 
         layout.addStretch()
         return widget
 
-    def _get_japreader_paths(self) -> list:
-        """Get list of common japReader installation paths to check."""
-        paths = []
-
-        # Common installation locations
-        program_files = os.environ.get('PROGRAMFILES', 'C:\\Program Files')
-        program_files_x86 = os.environ.get('PROGRAMFILES(X86)', 'C:\\Program Files (x86)')
-        local_appdata = os.environ.get('LOCALAPPDATA', '')
-        appdata = os.environ.get('APPDATA', '')
-        user_home = os.path.expanduser('~')
-
-        # japReader possible locations
-        possible_paths = [
-            os.path.join(program_files, 'japReader', 'japReader.exe'),
-            os.path.join(program_files_x86, 'japReader', 'japReader.exe'),
-            os.path.join(local_appdata, 'japReader', 'japReader.exe'),
-            os.path.join(appdata, 'japReader', 'japReader.exe'),
-            os.path.join(user_home, 'japReader', 'japReader.exe'),
-            os.path.join(local_appdata, 'Programs', 'japReader', 'japReader.exe'),
-            # GitHub releases often extract to Downloads or Desktop
-            os.path.join(user_home, 'Downloads', 'japReader', 'japReader.exe'),
-            os.path.join(user_home, 'Desktop', 'japReader', 'japReader.exe'),
-            # Portable installation in same directory as this app
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'japReader', 'japReader.exe'),
-        ]
-
-        return possible_paths
-
-    def _detect_japreader(self) -> Optional[str]:
-        """Detect japReader installation and update UI."""
-        # First check if user has a saved path
+    def _detect_japreader(self) -> None:
+        """Start japReader detection in the background; the UI updates on completion."""
         saved_path = self._settings.get("japreader_path", "")
+        self.japreaderDetected.connect(self._on_japreader_detected, Qt.ConnectionType.QueuedConnection)
+        QThreadPool.globalInstance().start(lambda: self._probe_japreader(saved_path))
+
+    def _probe_japreader(self, saved_path: str) -> None:
+        """Look for japReader on disk (runs in a thread pool worker)."""
+        # First check if user has a saved path
         if saved_path and os.path.isfile(saved_path):
-            self._japreader_path_edit.setText(saved_path)
-            self._japreader_status_label.setText("✓ japReader found (saved path)")
-            self._japreader_status_label.setStyleSheet("color: green; font-size: 10px;")
-            self._japreader_launch_btn.setEnabled(True)
-            log_debug(f"japReader found at saved path: {saved_path}")
-            return saved_path
+            path, source = saved_path, "saved"
+        else:
+            # Try auto-detection (all candidates are Windows executables),
+            # starting with wherever it was found last time
+            path, source = "", "auto"
+            if sys.platform == 'win32':
+                cached = SettingsDialog._cached_japreader_path
+                if cached and os.path.isfile(cached):
+                    path = cached
+                else:
+                    path = next((p for p in _japreader_candidate_paths() if os.path.isfile(p)), "")
+                if path:
+                    SettingsDialog._cached_japreader_path = path
 
-        # Try auto-detection
-        for path in self._get_japreader_paths():
-            if os.path.isfile(path):
+        try:
+            self.japreaderDetected.emit(path, source)
+        except RuntimeError:
+            pass  # Dialog was closed and deleted before detection finished
+
+    def _on_japreader_detected(self, path: str, source: str) -> None:
+        """Update the Integrations tab with the detection result."""
+        if self._japreader_path_edit.text():
+            return  # User browsed to a path while detection was running
+
+        if path:
+            # A detected path is not a user change, so keep the dialog clean
+            with _block_signals(self._japreader_path_edit):
                 self._japreader_path_edit.setText(path)
+            if source == "saved":
+                self._japreader_status_label.setText("✓ japReader found (saved path)")
+                log_debug(f"japReader found at saved path: {path}")
+            else:
                 self._japreader_status_label.setText("✓ japReader auto-detected")
-                self._japreader_status_label.setStyleSheet("color: green; font-size: 10px;")
-                self._japreader_launch_btn.setEnabled(True)
                 log_info(f"japReader auto-detected at: {path}")
-                return path
+            self._japreader_status_label.setStyleSheet("color: green; font-size: 10px;")
+            self._japreader_launch_btn.setEnabled(True)
+            return
 
         # Not found
         self._japreader_status_label.setText("japReader not found - please browse to locate")
         self._japreader_status_label.setStyleSheet("color: orange; font-size: 10px;")
         self._japreader_launch_btn.setEnabled(False)
         log_debug("japReader not found in common locations")
-        return None
 
     def _browse_japreader_path(self) -> None:
         """Browse for japReader executable."""
+        from PyQt6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Locate japReader",
-            os.path.expanduser("~"),
+            _user_home(),
             "Executable (*.exe);;All Files (*.*)"
         )
 
@@ -536,6 +686,7 @@ class SettingsDialog(QDialog):
             return
 
         try:
+            import subprocess
             # Launch without waiting (detached process)
             subprocess.Popen(
                 [path],
@@ -593,33 +744,55 @@ class SettingsDialog(QDialog):
         return widget
 
     def _load_settings(self) -> None:
-        """Load current settings into UI controls."""
-        self._hotkey_edit.set_hotkey(
-            self._settings.get("capture_hotkey", "ctrl+shift")
-        )
-
-        # OCR Engine
-        engine = self._settings.get("ocr_engine", OCREngine.MANGA_OCR.value)
-        engine_index = self._engine_combo.findData(engine)
-        if engine_index >= 0:
-            self._engine_combo.setCurrentIndex(engine_index)
-        self._update_engine_description()
-
-        mode = self._settings.get("preprocessing_mode", "none")
-        index = self._preprocess_combo.findData(mode)
-        if index >= 0:
-            self._preprocess_combo.setCurrentIndex(index)
-
-        self._auto_copy_cb.setChecked(
-            self._settings.get("auto_copy", True)
-        )
-        self._show_notification_cb.setChecked(
-            self._settings.get("show_notification", True)
-        )
-        self._start_minimized_cb.setChecked(
-            self._settings.get("start_minimized", True)
-        )
+        """
+        Load current settings into the General tab controls.
 
+        The other tabs load their own controls when they are built.
+        Signals and repaints are held off until every control is set.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            with _block_signals(
+                self._hotkey_edit, self._engine_combo, self._keep_engines_loaded_cb,
+                self._preprocess_combo, self._auto_copy_cb, self._show_notification_cb,
+                self._start_minimized_cb,
+            ):
+                self._hotkey_edit.set_hotkey(
+                    self._settings.get("capture_hotkey", "ctrl+shift")
+                )
+
+                # OCR Engine
+                engine = self._settings.get("ocr_engine", OCREngine.MANGA_OCR.value)
+                engine_index = self._engine_combo.findData(engine)
+                if engine_index >= 0:
+                    self._engine_combo.setCurrentIndex(engine_index)
+                self._keep_engines_loaded_cb.setChecked(
+                    self._settings.get("keep_engines_loaded", False)
+                )
+
+                mode = self._settings.get("preprocessing_mode", "none")
+                index = self._preprocess_combo.findData(mode)
+                if index >= 0:
+                    self._preprocess_combo.setCurrentIndex(index)
+
+                self._auto_copy_cb.setChecked(
+                    self._settings.get("auto_copy", True)
+                )
+                self._show_notification_cb.setChecked(
+                    self._settings.get("show_notification", True)
+                )
+                self._start_minimized_cb.setChecked(
+                    self._settings.get("start_minimized", True)
+                )
+
+            # The engine change signal was blocked, so update the description once here
+            self._update_engine_description()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _load_macro_settings(self) -> None:
+        """Load current settings into the Macros tab controls."""
         self._macro_enabled_cb.setChecked(
             self._settings.get("macro_enabled", False)
         )
@@ -634,28 +807,43 @@ class SettingsDialog(QDialog):
         else:
             self._macro_display.setText("")
 
-        # japReader settings
+    def _load_integrations_settings(self) -> None:
+        """Load current settings into the Integrations tab controls."""
         self._japreader_autolaunch_cb.setChecked(
             self._settings.get("japreader_autolaunch", False)
         )
 
     def _apply_settings(self) -> None:
         """Apply settings without closing dialog."""
+        if not self._dirty:
+            return
+        self._dirty = False
+
         self._settings["capture_hotkey"] = self._hotkey_edit.get_hotkey()
         self._settings["ocr_engine"] = self._engine_combo.currentData()
+        self._settings["keep_engines_loaded"] = self._keep_engines_loaded_cb.isChecked()
         self._settings["preprocessing_mode"] = self._preprocess_combo.currentData()
         self._settings["auto_copy"] = self._auto_copy_cb.isChecked()
         self._settings["show_notification"] = self._show_notification_cb.isChecked()
         self._settings["start_minimized"] = self._start_minimized_cb.isChecked()
-        self._settings["macro_enabled"] = self._macro_enabled_cb.isChecked()
-        self._settings["kill_key"] = self._kill_key_edit.get_hotkey()
 
-        # japReader settings
-        self._settings["japreader_autolaunch"] = self._japreader_autolaunch_cb.isChecked()
-        japreader_path = self._japreader_path_edit.text()
-        if japreader_path:
-            self._settings["japreader_path"] = japreader_path
+        # Tabs that were never opened still hold the values they started with
+        if hasattr(self, '_macro_enabled_cb'):
+            self._settings["macro_enabled"] = self._macro_enabled_cb.isChecked()
+            self._settings["kill_key"] = self._kill_key_edit.get_hotkey()
 
+        # japReader settings
+        if hasattr(self, '_japreader_autolaunch_cb'):
+            self._settings["japreader_autolaunch"] = self._japreader_autolaunch_cb.isChecked()
+            japreader_path = self._japreader_path_edit.text()
+            if japreader_path:
+                self._settings["japreader_path"] = japreader_path
+
+        diff = {k: v for k, v in self._settings.items() if k not in self._emitted or self._emitted[k] != v}
+        if not diff:
+            return
+        log_debug(f"Settings changed: {', '.join(diff)}")
+        self._emitted.update(diff)
         self.settingsChanged.emit(self._settings)
 
     def _ok_clicked(self) -> None:
@@ -669,13 +857,9 @@ class SettingsDialog(QDialog):
 
     def _update_engine_description(self) -> None:
         """Update the engine description label based on current selection."""
-        engine_value = self._engine_combo.currentData()
-        try:
-            engine = OCREngine(engine_value)
-            description = get_engine_description(engine)
-            self._engine_desc_label.setText(description)
-        except (ValueError, KeyError):
-            self._engine_desc_label.setText("")
+        self._engine_desc_label.setText(
+            self._engine_descriptions.get(self._engine_combo.currentData(), "")
+        )
 
     def _record_macro(self) -> None:
         """Start macro recording (handled by main app)."""
@@ -686,11 +870,13 @@ class SettingsDialog(QDialog):
             "Perform your actions, then press the kill key to stop."
         )
         self._settings["_start_macro_recording"] = True
+        self._dirty = True
 
     def _clear_macro(self) -> None:
         """Clear the recorded macro."""
         self._settings["macro_events"] = []
         self._macro_display.setText("")
+        self._dirty = True
 
     def get_settings(self) -> dict:
         """Get the current settings."""
@@ -6,10 +6,26 @@ with pyperclip as fallback.
 """
 
 from __future__ import annotations
-from typing import Optional
-from PIL import Image
+from typing import Optional, Tuple, TYPE_CHECKING
 import io
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+# Resolve the clipboard backends once at import time
+try:
+    from PyQt6.QtCore import QMimeData, Qt
+    from PyQt6.QtGui import QImage, QPixmap
+    from PyQt6.QtWidgets import QApplication
+    _QT_AVAILABLE = True
+except ImportError:
+    _QT_AVAILABLE = False
+
+try:
+    import pyperclip as _pyperclip
+except ImportError:
+    _pyperclip = None
+
 
 class ClipboardManager:
     """
@@ -28,27 +44,46 @@ class ClipboardManager:
         """
         self._use_qt = use_qt
         self._qt_clipboard = None
+        # Settled once the Qt clipboard is found, or known to be unusable
+        self._clipboard_resolved = not (use_qt and _QT_AVAILABLE)
+        self._get_qt_clipboard()
+        # Pixel buffer behind the last QImage handed to the clipboard
+        self._image_buffer: Optional[bytes] = None
+        # Image last set by copy_image, while it is still the clipboard contents
+        self._last_image: Optional[QImage] = None
 
     def _get_qt_clipboard(self):
         """Get Qt clipboard instance if available."""
-        if not self._use_qt:
-            return None
-
-        if self._qt_clipboard is not None:
+        if self._clipboard_resolved:
             return self._qt_clipboard
 
-        try:
-            from PyQt6.QtWidgets import QApplication
-            from PyQt6.QtGui import QClipboard
+        # No QApplication yet; try again on the next call
+        app = QApplication.instance()
+        if app is not None:
+            self._qt_clipboard = app.clipboard()
+            self._clipboard_resolved = True
+        return self._qt_clipboard
 
-            app = QApplication.instance()
-            if app is not None:
-                self._qt_clipboard = app.clipboard()
-                return self._qt_clipboard
-        except ImportError:
-            pass
+    @staticmethod
+    def _pil_to_qimage(image: Image.Image) -> Tuple[QImage, bytes]:
+        """
+        Wrap a PIL image's pixels in a QImage.
 
-        return None
+        The pixels are packed once and the QImage references that buffer
+        rather than copying it. Clipboard data can share the QImage long
+        after it is set, so callers keep the returned buffer in
+        ``_image_buffer`` for as long as the clipboard may hold it.
+        """
+        # RGB screenshots map straight onto RGB888; only other modes are expanded
+        if image.mode == 'RGB':
+            mode, channels, fmt = 'RGB', 3, QImage.Format.Format_RGB888
+        else:
+            if image.mode != 'RGBA':
+                image = image.convert('RGBA')
+            mode, channels, fmt = 'RGBA', 4, QImage.Format.Format_RGBA8888
+
+        data = image.tobytes('raw', mode)
+        return QImage(data, image.width, image.height, image.width * channels, fmt), data
 
     def copy_text(self, text: str) -> bool:
         """
@@ -64,15 +99,23 @@ class ClipboardManager:
         qt_clip = self._get_qt_clipboard()
         if qt_clip is not None:
             try:
+                # Setting the clipboard announces a new owner to the system;
+                # skip it when we already hold exactly this text and nothing else
+                if qt_clip.ownsClipboard() and qt_clip.text() == text:
+                    mime_data = qt_clip.mimeData()
+                    if mime_data is None or not mime_data.hasImage():
+                        return True
                 qt_clip.setText(text)
+                self._last_image = None
                 return True
             except Exception as e:
                 print(f"Qt clipboard error: {e}")
 
         # Fall back to pyperclip
+        if _pyperclip is None:
+            return False
         try:
-            import pyperclip
-            pyperclip.copy(text)
+            _pyperclip.copy(text)
             return True
         except Exception as e:
             print(f"pyperclip error: {e}")
@@ -91,20 +134,23 @@ class ClipboardManager:
         qt_clip = self._get_qt_clipboard()
         if qt_clip is not None:
             try:
-                from PyQt6.QtGui import QImage, QPixmap
-
-                # Convert PIL Image to QImage
-                if image.mode != 'RGBA':
-                    image = image.convert('RGBA')
-
-                data = image.tobytes('raw', 'RGBA')
-                qimage = QImage(
-                    data,
-                    image.width,
-                    image.height,
-                    QImage.Format.Format_RGBA8888
+                qimage, data = self._pil_to_qimage(image)
+                # The clipboard pixmap may share the previous buffer, so on a
+                # match keep the previous image and buffer and drop the new ones
+                if (
+                    self._last_image is not None
+                    and qt_clip.ownsClipboard()
+                    and qimage == self._last_image
+                ):
+                    return True
+
+                # Always the native fromImage classmethod, never QPixmap(qimage);
+                # the buffer is already display-ready, so skip reformatting
+                qt_clip.setPixmap(
+                    QPixmap.fromImage(qimage, Qt.ImageConversionFlag.NoFormatConversion)
                 )
-                qt_clip.setPixmap(QPixmap.fromImage(qimage))
+                self._image_buffer = data
+                self._last_image = qimage
                 return True
             except Exception as e:
                 print(f"Qt image clipboard error: {e}")
@@ -125,28 +171,18 @@ class ClipboardManager:
         qt_clip = self._get_qt_clipboard()
         if qt_clip is not None:
             try:
-                from PyQt6.QtCore import QMimeData
-                from PyQt6.QtGui import QImage, QPixmap
-
                 mime_data = QMimeData()
 
                 # Add text
                 mime_data.setText(text)
 
                 # Add image
-                if image.mode != 'RGBA':
-                    image = image.convert('RGBA')
-
-                data = image.tobytes('raw', 'RGBA')
-                qimage = QImage(
-                    data,
-                    image.width,
-                    image.height,
-                    QImage.Format.Format_RGBA8888
-                )
+                qimage, data = self._pil_to_qimage(image)
                 mime_data.setImageData(qimage)
 
                 qt_clip.setMimeData(mime_data)
+                self._image_buffer = data
+                self._last_image = None
                 return True
             except Exception as e:
                 print(f"Qt MIME clipboard error: {e}")
@@ -169,9 +205,10 @@ class ClipboardManager:
             except Exception:
                 pass
 
+        if _pyperclip is None:
+            return None
         try:
-            import pyperclip
-            text = pyperclip.paste()
+            text = _pyperclip.paste()
             return text if text else None
         except Exception:
             return None
@@ -186,28 +223,13 @@ class ClipboardManager:
         qt_clip = self._get_qt_clipboard()
         if qt_clip is not None:
             try:
-                from PyQt6.QtGui import QImage
-
                 qimage = qt_clip.image()
                 if qimage.isNull():
                     return None
 
                 # Convert QImage to PIL Image
-                qimage = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
-                width = qimage.width()
-                height = qimage.height()
-
-                ptr = qimage.bits()
-                ptr.setsize(qimage.sizeInBytes())
-
-                image = Image.frombytes(
-                    'RGBA',
-                    (width, height),
-                    bytes(ptr),
-                    'raw',
-                    'RGBA'
-                )
-                return image
+                from .image_ops import qimage_to_pil
+                return qimage_to_pil(qimage, 'RGBA')
             except Exception as e:
                 print(f"Qt image read error: {e}")
 
@@ -7,14 +7,20 @@ and performance timing utilities.
 """
 
 from __future__ import annotations
+import atexit
 import logging
 import os
 import sys
 import time
 import platform
 import functools
+import re
+import itertools
+import mmap
+import queue
+import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional, Callable, Any
 from contextlib import contextmanager
 
@@ -25,9 +31,24 @@ LOG_FILE = "daisho.log"
 MAX_LOG_SIZE = 5 * 1024 * 1024  # 5 MB
 BACKUP_COUNT = 3  # Keep 3 old log files
 
+# Level column of a log line, as written by the '%(levelname)-8s' format field
+_ERROR_MARKERS = (b'| ERROR    |', b'| CRITICAL |')
+_WARNING_MARKERS = (b'| WARNING  |',)
+_ERROR_PATTERN = re.compile(b'|'.join(map(re.escape, _ERROR_MARKERS)))
+_WARNING_PATTERN = re.compile(b'|'.join(map(re.escape, _WARNING_MARKERS)))
+
 # Global logger instance
 _logger: Optional[logging.Logger] = None
 
+# Background thread that writes queued records to the log file
+_file_listener: Optional[QueueListener] = None
+
+# Level methods of the global logger, bound once it is set up
+_debug: Optional[Callable[..., None]] = None
+_info: Optional[Callable[..., None]] = None
+_warning: Optional[Callable[..., None]] = None
+_error: Optional[Callable[..., None]] = None
+
 
 def setup_logger(
     name: str = "代書",
@@ -49,7 +70,7 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    global _logger
+    global _logger, _file_listener, _debug, _info, _warning, _error
 
     if _logger is not None:
         return _logger
@@ -72,7 +93,7 @@ def setup_logger(
         datefmt='%H:%M:%S'
     )
 
-    # File handler with rotation
+    # File handler with rotation, fed from a queue so callers never wait on disk I/O
     if log_to_file:
         try:
             # Create logs directory if it doesn't exist
@@ -84,11 +105,20 @@ def setup_logger(
                 log_path,
                 maxBytes=MAX_LOG_SIZE,
                 backupCount=BACKUP_COUNT,
-                encoding='utf-8'
+                encoding='utf-8',
+                delay=True  # Open the file with the first record, not at setup
             )
             file_handler.setLevel(log_level)
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(log_level)
+            logger.addHandler(queue_handler)
+
+            _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            _file_listener.start()
+            atexit.register(_stop_file_listener)
 
         except Exception as e:
             print(f"Warning: Could not set up file logging: {e}")
@@ -101,6 +131,7 @@ def setup_logger(
         logger.addHandler(console_handler)
 
     _logger = logger
+    _debug, _info, _warning, _error = logger.debug, logger.info, logger.warning, logger.error
 
     # Log startup
     logger.info("=" * 60)
@@ -110,6 +141,14 @@ def setup_logger(
     return logger
 
 
+def _stop_file_listener() -> None:
+    """Write out any queued records and stop the file logging thread."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
 def get_logger() -> logging.Logger:
     """Get the application logger, creating it if necessary."""
     global _logger
@@ -134,24 +173,24 @@ def log_exception(exc: Exception, context: str = "") -> None:
     logger.debug("Full traceback:", exc_info=True)
 
 
-def log_debug(message: str) -> None:
-    """Log a debug message."""
-    get_logger().debug(message)
+def log_debug(message: str, *args: Any) -> None:
+    """Log a debug message, %-formatting any args only if the level is enabled."""
+    (_debug or get_logger().debug)(message, *args)
 
 
-def log_info(message: str) -> None:
-    """Log an info message."""
-    get_logger().info(message)
+def log_info(message: str, *args: Any) -> None:
+    """Log an info message, %-formatting any args only if the level is enabled."""
+    (_info or get_logger().info)(message, *args)
 
 
-def log_warning(message: str) -> None:
-    """Log a warning message."""
-    get_logger().warning(message)
+def log_warning(message: str, *args: Any) -> None:
+    """Log a warning message, %-formatting any args only if the level is enabled."""
+    (_warning or get_logger().warning)(message, *args)
 
 
-def log_error(message: str) -> None:
-    """Log an error message."""
-    get_logger().error(message)
+def log_error(message: str, *args: Any) -> None:
+    """Log an error message, %-formatting any args only if the level is enabled."""
+    (_error or get_logger().error)(message, *args)
 
 
 class LogCapture:
@@ -176,13 +215,15 @@ class LogCapture:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        sys.stdout.flush()
+        sys.stderr.flush()
         sys.stdout = self._stdout
         sys.stderr = self._stderr
         return False
 
 
 class _LogWriter:
-    """File-like object that writes to a logger."""
+    """File-like object that writes to a logger, one record per line."""
 
     def __init__(self, logger: logging.Logger, level: int):
         self._logger = logger
@@ -190,11 +231,22 @@ class _LogWriter:
         self._buffer = ""
 
     def write(self, message: str) -> None:
-        if message and message.strip():
-            self._logger.log(self._level, message.rstrip())
+        # print() sends the text and its newline as separate writes, so hold
+        # partial lines until they are complete
+        if not message:
+            return
+        self._buffer += message
+        if '\n' not in message:
+            return
+        *lines, self._buffer = self._buffer.split('\n')
+        for line in lines:
+            if line.strip():
+                self._logger.log(self._level, line.rstrip())
 
     def flush(self) -> None:
-        pass
+        if self._buffer.strip():
+            self._logger.log(self._level, self._buffer.rstrip())
+        self._buffer = ""
 
 
 # =============================================================================
@@ -225,14 +277,15 @@ def log_system_info() -> None:
     except ImportError:
         logger.debug("psutil not available for memory info")
 
-    # GPU info
-    _log_gpu_info(logger)
-
     # Key package versions
     _log_package_versions(logger)
 
     logger.info("-" * 60)
 
+    # GPU info needs torch and paddle imported, which takes seconds, so it
+    # is checked and logged from a background thread
+    threading.Thread(target=_log_gpu_info, args=(logger,), name="gpu-info", daemon=True).start()
+
 
 def _log_gpu_info(logger: logging.Logger) -> None:
     """Log GPU availability and information."""
@@ -269,37 +322,34 @@ def _log_gpu_info(logger: logging.Logger) -> None:
 
 
 def _log_package_versions(logger: logging.Logger) -> None:
-    """Log versions of key packages."""
+    """Log versions of key packages from their installed metadata, without importing them."""
+    from importlib.metadata import version, PackageNotFoundError
+
+    # Package label and the distribution names it may be installed under
     packages = [
-        "PyQt6",
-        "manga_ocr",
-        "paddleocr",
-        "paddlepaddle",
-        "torch",
-        "opencv-python-headless",
-        "Pillow",
-        "numpy",
+        ("PyQt6", ("PyQt6",)),
+        ("manga_ocr", ("manga-ocr",)),
+        ("paddleocr", ("paddleocr",)),
+        ("paddlepaddle", ("paddlepaddle", "paddlepaddle-gpu")),
+        ("torch", ("torch",)),
+        ("opencv-python-headless", ("opencv-python-headless", "opencv-python", "opencv-contrib-python")),
+        ("Pillow", ("Pillow",)),
+        ("numpy", ("numpy",)),
     ]
 
     logger.info("Package Versions:")
-    for pkg in packages:
-        try:
-            # Handle package name variations
-            import_name = pkg.replace("-", "_").replace("opencv_python_headless", "cv2")
-            if import_name == "cv2":
-                import cv2
-                version = cv2.__version__
-            elif import_name == "Pillow":
-                from PIL import __version__ as version
-            else:
-                import importlib
-                mod = importlib.import_module(import_name)
-                version = getattr(mod, "__version__", "unknown")
-            logger.info(f"  {pkg}: {version}")
-        except ImportError:
+    for pkg, distributions in packages:
+        for distribution in distributions:
+            try:
+                logger.info(f"  {pkg}: {version(distribution)}")
+                break
+            except PackageNotFoundError:
+                continue
+            except Exception as e:
+                logger.debug(f"  {pkg}: Error getting version - {e}")
+                break
+        else:
             logger.debug(f"  {pkg}: Not installed")
-        except Exception as e:
-            logger.debug(f"  {pkg}: Error getting version - {e}")
 
 
 # =============================================================================
@@ -317,15 +367,15 @@ def log_timing(operation: str, level: int = logging.DEBUG):
     """
     logger = get_logger()
     start = time.perf_counter()
-    logger.log(level, f"Starting: {operation}")
+    logger.log(level, "Starting: %s", operation)
     try:
         yield
     finally:
         elapsed = time.perf_counter() - start
         if elapsed < 1:
-            logger.log(level, f"Completed: {operation} in {elapsed*1000:.1f}ms")
+            logger.log(level, "Completed: %s in %.1fms", operation, elapsed * 1000)
         else:
-            logger.log(level, f"Completed: {operation} in {elapsed:.2f}s")
+            logger.log(level, "Completed: %s in %.2fs", operation, elapsed)
 
 
 def timed(func: Callable) -> Callable:
@@ -343,7 +393,7 @@ def timed(func: Callable) -> Callable:
         try:
             result = func(*args, **kwargs)
             elapsed = time.perf_counter() - start
-            log_debug(f"{func.__name__} completed in {elapsed*1000:.1f}ms")
+            log_debug("%s completed in %.1fms", func.__name__, elapsed * 1000)
             return result
         except Exception as e:
             elapsed = time.perf_counter() - start
@@ -356,6 +406,53 @@ def timed(func: Callable) -> Callable:
 # Log Analysis Utilities
 # =============================================================================
 
+def _iter_lines_reverse(path: str, markers: tuple[bytes, ...] = (), chunk_size: int = 65536):
+    """
+    Yield the lines of a file as raw bytes, last line first.
+
+    Reads fixed-size chunks backwards from the end, so finding recent
+    entries costs time proportional to how far back they are. If markers
+    are given, only lines containing one of them are yielded, and chunks
+    without any are skipped without being split into lines.
+    """
+    with open(path, 'rb') as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b''
+        while position > 0:
+            read_size = min(chunk_size, position)
+            position -= read_size
+            f.seek(position)
+            block = f.read(read_size) + remainder
+            if position > 0:
+                # Text before the first newline may continue in the previous chunk
+                remainder, newline, block = block.partition(b'\n')
+                if not newline:
+                    continue
+            if markers and not any(marker in block for marker in markers):
+                continue
+            for line in reversed(block.split(b'\n')):
+                if not markers or any(marker in line for marker in markers):
+                    yield line
+
+
+def _recent_matching(count: int, *markers: bytes) -> list[str]:
+    """Return the last ``count`` log lines containing any of the markers, oldest first."""
+    log_path = os.path.join(LOG_DIR, LOG_FILE)
+    if count <= 0 or not os.path.exists(log_path):
+        return []
+
+    matches = []
+    try:
+        for line in _iter_lines_reverse(log_path, markers):
+            matches.append(line.decode('utf-8', errors='replace').strip())
+            if len(matches) == count:
+                break
+    except Exception:
+        return []
+    matches.reverse()
+    return matches
+
+
 def get_recent_errors(count: int = 10) -> list[str]:
     """
     Read and return recent ERROR level entries from the log file.
@@ -366,19 +463,7 @@ def get_recent_errors(count: int = 10) -> list[str]:
     Returns:
         List of recent error log lines
     """
-    log_path = os.path.join(LOG_DIR, LOG_FILE)
-    if not os.path.exists(log_path):
-        return []
-
-    errors = []
-    try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if '| ERROR' in line or '| CRITICAL' in line:
-                    errors.append(line.strip())
-        return errors[-count:]
-    except Exception:
-        return []
+    return _recent_matching(count, *_ERROR_MARKERS)
 
 
 def get_recent_warnings(count: int = 10) -> list[str]:
@@ -391,19 +476,7 @@ def get_recent_warnings(count: int = 10) -> list[str]:
     Returns:
         List of recent warning log lines
     """
-    log_path = os.path.join(LOG_DIR, LOG_FILE)
-    if not os.path.exists(log_path):
-        return []
-
-    warnings = []
-    try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if '| WARNING' in line:
-                    warnings.append(line.strip())
-        return warnings[-count:]
-    except Exception:
-        return []
+    return _recent_matching(count, *_WARNING_MARKERS)
 
 
 def check_log_health() -> dict:
@@ -429,23 +502,29 @@ def check_log_health() -> dict:
     result["log_exists"] = True
     result["log_size_kb"] = os.path.getsize(log_path) / 1024
 
-    try:
-        with open(log_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+    if result["log_size_kb"] == 0:
+        return result  # mmap cannot map an empty file
 
-        for line in lines:
-            if '| ERROR' in line or '| CRITICAL' in line:
-                result["error_count"] += 1
-                result["recent_errors"].append(line.strip())
-            elif '| WARNING' in line:
-                result["warning_count"] += 1
+    try:
+        # Count level columns over the mapped file instead of iterating lines
+        with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            result["error_count"] = len(_ERROR_PATTERN.findall(mm))
+            result["warning_count"] = len(_WARNING_PATTERN.findall(mm))
+            ends_with_newline = mm[-1:] == b'\n'
 
         # Keep only last 5 errors
-        result["recent_errors"] = result["recent_errors"][-5:]
+        recent_errors = list(itertools.islice(_iter_lines_reverse(log_path, _ERROR_MARKERS), 5))
+        result["recent_errors"] = [
+            line.decode('utf-8', errors='replace').strip() for line in reversed(recent_errors)
+        ]
 
         # Get last entry
-        if lines:
-            result["last_entry"] = lines[-1].strip()
+        lines = _iter_lines_reverse(log_path)
+        if ends_with_newline:
+            next(lines, None)
+        last_line = next(lines, None)
+        if last_line is not None:
+            result["last_entry"] = last_line.decode('utf-8', errors='replace').strip()
 
     except Exception as e:
         result["read_error"] = str(e)